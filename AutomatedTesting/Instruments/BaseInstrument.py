@@ -2,16 +2,229 @@ import logging
 import os
 import re
 import signal
-from multiprocessing import Lock, Process
-from time import sleep
-from typing import List, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from queue import Queue
+from threading import Event, Lock, RLock, Thread, current_thread, main_thread
+from time import monotonic, sleep
+from typing import List, Tuple, Union
 
 from pyvisa import ResourceManager, VisaIOError
+from pyvisa.constants import EventMechanism, EventType, StatusCode
 from serial import SerialException
 
+# Matches each <code>,"<message>" pair in a SYST:ERR? response
+SCPI_ERROR_PATTERN = re.compile(r'([+-]?\d+),"([^"]*)"')
+
+# Matches the device path of a serial VISA address
+# e.g. "ASRL/dev/ttyUSB0::INSTR"
+SERIAL_DEVICE_PATTERN = re.compile(r"ASRL(/dev/[^:]+)::INSTR")
+
+# Latency timer (in ms) of USB-serial adapters that have one e.g. FTDI
+USB_SERIAL_LATENCY_TIMER = "/sys/bus/usb-serial/devices/{}/latency_timer"
+
+
+def is_query_only(command: str) -> bool:
+    """
+    Returns True if every command in <command> (which may be a compound
+    command) is a query, so sending it can't change any settings
+    """
+    for x in command.split(";"):
+        header = x.split(maxsplit=1)
+        if header and not header[0].endswith("?"):
+            return False
+    return True
+
+
+def set_usb_serial_low_latency(visa_address: str) -> bool:
+    """
+    Sets the latency timer of the USB-serial adapter behind visa_address
+    to 1ms. The default of 16ms otherwise puts a floor under the time
+    taken for every query. Returns True if the latency timer was set
+    """
+    match = SERIAL_DEVICE_PATTERN.fullmatch(visa_address)
+    if not match:
+        return False
+    device = os.path.basename(os.path.realpath(match.group(1)))
+    try:
+        with open(USB_SERIAL_LATENCY_TIMER.format(device), "w") as f:
+            f.write("1")
+    except OSError:
+        # Adapter doesn't have a latency timer or we don't have permission
+        return False
+    return True
+
 
 class InstrumentConnectionError(Exception):
-    pass
+    """
+    Raised when the connection to an instrument fails. Available VISA
+    addresses are only listed if the error is actually displayed, as
+    scanning for them can take several seconds. The result of the scan is
+    reused for a short time so a run of failed connections only scans once
+    """
+
+    RESOURCE_SCAN_LIFETIME = 30  # seconds
+
+    # (resource manager, time of scan, addresses found) from the last scan
+    _last_resource_scan = None
+
+    def __init__(
+        self, name: str, visa_address: str, resource_manager: ResourceManager
+    ):
+        super().__init__(name, visa_address)
+        self.name = name
+        self.visa_address = visa_address
+        self.resource_manager = resource_manager
+
+    @property
+    def available_resources(self) -> Tuple[str, ...]:
+        last_scan = InstrumentConnectionError._last_resource_scan
+        if (
+            last_scan is None
+            or last_scan[0] is not self.resource_manager
+            or monotonic() - last_scan[1] > self.RESOURCE_SCAN_LIFETIME
+        ):
+            last_scan = (
+                self.resource_manager,
+                monotonic(),
+                self.resource_manager.list_resources(),
+            )
+            InstrumentConnectionError._last_resource_scan = last_scan
+        return last_scan[2]
+
+    def __str__(self) -> str:
+        return (
+            f'Connection to "{self.name}" at VISA address '
+            f'"{self.visa_address}" failed.\r\nAvailable VISA address:'
+            f" {self.available_resources}"
+        )
+
+
+class ErrorMonitor:
+    """
+    Single background thread that periodically checks every registered
+    instrument for errors, rather than running one thread per instrument.
+    The thread is started when the first instrument is registered and
+    stopped once the last one is unregistered
+
+    Errors found are put in the errors queue and the error flag is set.
+    The first error also raises SIGUSR1 in the main thread so it can shut
+    down, even when it is busy running a test rather than checking the flag
+    """
+
+    POLL_INTERVAL = 3  # seconds
+
+    def __init__(self):
+        self.instruments = []
+        # Held while the instrument list is changed or copied. Never held
+        # while taking an instrument's lock, so it can't deadlock with an
+        # instrument holding its own lock that stops being monitored
+        self.lock = Lock()
+        self.thread = None
+        self.stop_flag = None
+        self.errors = Queue()  # (name, error code, error message) reported
+        self.error_flag = Event()  # Set once any error has been reported
+
+    def register(self, instrument: "BaseInstrument"):
+        with self.lock:
+            self.instruments.append(instrument)
+            if self.thread is None:
+                self.error_flag.clear()
+                # Fresh flag per thread so a stopping thread can't be
+                # revived by a later register()
+                self.stop_flag = Event()
+                self.thread = Thread(
+                    target=self._run,
+                    args=[self.stop_flag],
+                    daemon=True,
+                )
+                self.thread.start()
+
+    def unregister(self, instrument: "BaseInstrument"):
+        """
+        Stops monitoring instrument. Blocks until any check currently being
+        made has finished so the connection can be safely closed afterwards
+        """
+        thread = None
+        with self.lock:
+            self.instruments.remove(instrument)
+            if not self.instruments:
+                self.stop_flag.set()
+                thread = self.thread
+                self.thread = None
+        # Checks are made holding the instrument's lock, so once we have it
+        # any check in progress has finished
+        with instrument.lock:
+            pass
+        if thread:
+            thread.join()
+
+    def report_errors(self, name: str, error_list: List[Tuple[int, str]]):
+        """
+        Records errors from the instrument (or channel) called name and
+        informs the main thread
+        """
+        for code, message in error_list:
+            self.errors.put((name, code, message))
+        if not self.error_flag.is_set():
+            self.error_flag.set()
+            # Only interrupt the main thread once, so it isn't interrupted
+            # again while shutting down
+            signal.pthread_kill(main_thread().ident, signal.SIGUSR1)
+
+    def _run(self, stop_flag: Event):
+        while not stop_flag.wait(self.POLL_INTERVAL):
+            with self.lock:
+                instruments = list(self.instruments)
+            for instrument in instruments:
+                if stop_flag.is_set():
+                    return
+                # Hold the instrument's lock for the whole check so the
+                # instrument and its channels don't change part way through.
+                # If it's busy for a long time, check it next time round
+                if not instrument.lock.acquire(timeout=self.POLL_INTERVAL):
+                    continue
+                try:
+                    # Skip it if it was unregistered while waiting
+                    if instrument in self.instruments:
+                        instrument.check_instrument_errors()
+                except Exception:
+                    # Don't let one instrument stop monitoring of the rest
+                    instrument.logger.exception(
+                        f"Error monitoring failed for {instrument.name}"
+                    )
+                finally:
+                    instrument.lock.release()
+
+
+error_monitor = ErrorMonitor()
+
+# Threads shared by all instruments for running commands on several
+# instruments at once. Each instrument's lock still stops two threads
+# talking to the same instrument at the same time
+INSTRUMENT_IO_WORKERS = 8
+INSTRUMENT_IO_THREAD_PREFIX = "instrument_io"
+instrument_io_pool = ThreadPoolExecutor(
+    max_workers=INSTRUMENT_IO_WORKERS, thread_name_prefix=INSTRUMENT_IO_THREAD_PREFIX
+)
+
+
+def submit_instrument_io(fn, *args, **kwargs) -> Future:
+    """
+    Runs fn(*args, **kwargs) on the shared instrument I/O threads and
+    returns a Future for the result. If already on one of those threads, fn
+    is run straight away instead, as waiting on the pool from inside it
+    could deadlock once every thread is waiting
+    """
+    if not current_thread().name.startswith(INSTRUMENT_IO_THREAD_PREFIX):
+        return instrument_io_pool.submit(fn, *args, **kwargs)
+
+    future = Future()
+    try:
+        future.set_result(fn(*args, **kwargs))
+    except Exception as e:
+        future.set_exception(e)
+    return future
 
 
 class BaseInstrument:
@@ -29,6 +242,21 @@ class BaseInstrument:
 
     """
 
+    # Longest time (in seconds) to wait for a reset to complete
+    RESET_TIMEOUT = 30
+
+    # Whether the instrument accepts SCPI compound commands (several
+    # commands separated by ";" in one message). Drivers for instruments
+    # known to support them should set this to True
+    SUPPORTS_COMPOUND_COMMANDS = False
+
+    # Longest message (in characters) to send in one write
+    MAX_MESSAGE_LENGTH = 256
+
+    # Query, Device Dependent, Execution and Command Error bits of the
+    # Standard Event Status Register
+    ESR_ERROR_BITS = 0b00111100
+
     def __init__(
         self,
         resource_manager: ResourceManager,
@@ -38,6 +266,7 @@ class BaseInstrument:
         verify: bool,
         logger: logging.Logger,
         only_software_control: bool = True,
+        prefer_binary: bool = False,
         **kwargs,
     ):
         self.resource_manager = resource_manager
@@ -46,17 +275,67 @@ class BaseInstrument:
         self.expected_idn_response = expected_idn_response
         self.verify = verify
         self.logger = logger
+        # Have pyvisa stop reading at the end of the line. Drivers for
+        # instruments that terminate differently can override this. Responses
+        # are still stripped as some instruments also send "\r" or padding
+        kwargs.setdefault("read_termination", "\n")
         self.kwargs = kwargs
         self.only_software_control = only_software_control
-        self.error_process = None
+        # Use binary rather than ASCII for bulk data transfers where the
+        # driver supports it
+        self.prefer_binary = prefer_binary
+        self.error_monitored = False
+        # True if errors are reported by service request rather than polled
+        self.error_srq_enabled = False
         self.instrument_name = name
 
         self.dev = None  # Connection to the device
-        self.lock = Lock()  # lock for access to the device connection
+        self.idn = None  # IDN response, cached while the connection is open
+        # lock for access to the device connection. Reentrant so a caller
+        # can hold it across several _write()/_query() calls to keep
+        # another thread's commands out of a sequence
+        self.lock = RLock()
+
+        # Responses to queries of settings, cleared whenever anything is
+        # written to the device. See _cached_query()
+        self.query_cache = {}
+
+        # Thread running a batch() block and the commands it has written
+        self.batch_thread = None
+        self.pending_writes = []
+
+        # Thread running a deferred_verification() block and the settings
+        # it is waiting to read back, as {getter: expected value}
+        self.deferred_verify_thread = None
+        self.pending_verifications = {}
+
+    @property
+    def verify(self) -> bool:
+        """
+        Whether settings should be read back after being set. Always False
+        in the thread running a batch() block, as the whole batch is
+        checked once at the end instead. Other threads are unaffected
+        """
+        return self._verify and self.batch_thread is not current_thread()
+
+    @verify.setter
+    def verify(self, verify: bool):
+        self._verify = verify
 
     def __enter__(self):
         self.initialise()
 
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """
+        Runs fn(*args, **kwargs) on the shared instrument I/O threads and
+        returns a Future for the result, so commands to other instruments
+        can be made while this one is busy. e.g.
+            voltage = psu.submit(psu.measure_channel_voltage, 1)
+            power = power_meter.submit(power_meter.measure_power, 1e9)
+            print(voltage.result(), power.result())
+        """
+        return submit_instrument_io(fn, *args, **kwargs)
+
     def initialise(self):
         """
         Opens connection to the instrument, checks the IDN response is correct
@@ -65,15 +344,14 @@ class BaseInstrument:
         self.open_connection()
         self.logger.info(f"Connected to {self.name}")
 
-        # Reset the Device and start error monitoring thread only if only under software control
+        # Reset the Device and start error monitoring only if only under software control
         # (as opposed to being used interactively)
         if self.only_software_control:
             self.reset()
 
-            self.error_process = Process(
-                target=self.check_instrument_errors, args=[os.getpid()], daemon=True
-            )
-            self.error_process.start()
+            self.error_srq_enabled = self._enable_error_srq()
+            error_monitor.register(self)
+            self.error_monitored = True
 
         self.logger.info(f"{self.name} initialised")
 
@@ -81,28 +359,35 @@ class BaseInstrument:
         self.cleanup()
 
     def cleanup(self):
+        if self.error_monitored:
+            error_monitor.unregister(self)
+            self.error_monitored = False
         if self.only_software_control:
+            if self.error_srq_enabled:
+                self._disable_error_srq()
+                self.error_srq_enabled = False
             self.set_local_control()
-            if self.error_process:
-                self.error_process.terminate()
         if self.dev:
             self.dev.close()
             self.dev = None
+            self.idn = None
+            self.query_cache.clear()
             self.logger.info(f"Connection to {self.name} closed")
 
     def open_connection(self):
         """
         Opens the connection to the device
         """
+        if set_usb_serial_low_latency(self.visa_address):
+            self.logger.debug(f"Set USB-serial latency timer for {self.name} to 1ms")
+
         try:
             self.dev = self.resource_manager.open_resource(
                 self.visa_address, **self.kwargs
             )
         except (VisaIOError, ValueError, SerialException):
             raise InstrumentConnectionError(
-                f'Connection to "{self.name}" at VISA address '
-                f'"{self.visa_address}" failed.\r\nAvailable VISA address:'
-                f" {self.resource_manager.list_resources()}"
+                self.name, self.visa_address, self.resource_manager
             )
 
         # Lock front panel control of the instrument
@@ -119,18 +404,27 @@ class BaseInstrument:
     def test_connection(self) -> bool:
         """
         Tests whether the instruments can be connected to.
-        Return True if this is possible
+        Return True if this is possible or already connected
         """
+        if self.dev:
+            # Already connected (and the IDN checked when that connection
+            # was opened). Opening a second session would replace the one
+            # in use and then close it
+            return True
+
         try:
             self.open_connection()
-            return True
+            status = True
         except (InstrumentConnectionError, VisaIOError):
-            return False
+            status = False
         finally:
             if self.dev:
                 # Just in case the instrument automatically goes to remote
                 self.set_local_control()
                 self.dev.close()
+                self.dev = None
+                self.idn = None
+        return status
 
     def is_connected(self) -> bool:
         """Returns True if connected to the instrument"""
@@ -149,112 +443,388 @@ class BaseInstrument:
         """
         pass
 
-    def check_instrument_errors(self, pid: int):
+    def check_instrument_errors(self):
         """
-        This function should be run in a separate thread.
+        Called periodically from the error monitoring thread.
         It queries the instrument then processes the results
-        and decides whether to flag an issue to the main process
-        """
-        self.logger.debug(f"Started error monitoring thread for {self.name}")
-        while True:
-            sleep(3)
-            error_list = self.get_instrument_errors()
-            if error_list:
-                for code, message in error_list:
-                    self.logger.error(
-                        f"{self.name} reporting error "
-                        f"{code} ({message}). Shutting down..."
-                    )
-
-                # Inform main thread
-                os.kill(pid, signal.SIGUSR1)
+        and decides whether to flag an issue to the main thread.
+        If the instrument reports errors by service request, it is only
+        queried once one has been raised
+        """
+        if self.error_srq_enabled:
+            if not self._service_requested():
+                return
+            # Clear the event status register so the next error raises
+            # another service request
+            self._query("*ESR?")
+        error_list = self.get_instrument_errors()
+        if error_list:
+            for code, message in error_list:
+                self.logger.error(
+                    f"{self.name} reporting error "
+                    f"{code} ({message}). Shutting down..."
+                )
+
+            error_monitor.report_errors(self.name, error_list)
 
     def get_instrument_errors(self) -> List[Tuple[int, str]]:
         """
         Function to extract error messages from the device.
         This can be overwritten by sub-classes if this uses different syntax
         """
-        error_list = []
         errors = self._query("SYST:ERR?")
+        # The error queue is empty almost every time it's checked, in
+        # which case the first entry is always code 0
+        if errors.startswith(("0,", "+0,")):
+            return []
 
-        for x in errors.split('",'):
-            code, message = x.split(",")
-            message.replace('"', "")
-            # Last item in list isn't comma terminated so need
-            # to manually remove trailing speech marks
-            code = int(code)
+        error_list = []
+        for match in SCPI_ERROR_PATTERN.finditer(errors):
+            code = int(match.group(1))
             if code:
-                error_list.append((code, message))
+                error_list.append((code, match.group(2)))
         return error_list
 
+    def _enable_error_srq(self) -> bool:
+        """
+        Routes the error bits of the Standard Event Status Register to the
+        Service Request, so errors can be picked up without polling the
+        instrument.
+        Returns False if the connection doesn't support service requests
+        """
+        try:
+            self.dev.enable_event(EventType.service_request, EventMechanism.queue)
+        except (VisaIOError, NotImplementedError):
+            return False
+
+        self._write_batch(["*CLS", f"*ESE {self.ESR_ERROR_BITS}", "*SRE 32"])
+        return True
+
+    def _disable_error_srq(self):
+        self._write_batch(["*SRE 0", "*ESE 0"])
+        self.dev.disable_event(EventType.service_request, EventMechanism.queue)
+        self.dev.discard_events(EventType.service_request, EventMechanism.queue)
+
+    def _service_requested(self) -> bool:
+        """
+        Returns True if the instrument has raised a service request.
+        This only checks the local event queue so doesn't use the bus
+        """
+        try:
+            self.dev.wait_on_event(EventType.service_request, 0)
+        except VisaIOError as e:
+            if e.error_code == StatusCode.error_timeout:
+                return False
+            raise
+        return True
+
+    def verify_batch(self):
+        """
+        Checks that none of the commands sent since the last check caused
+        an error. Sending a batch of settings and then calling this once
+        avoids reading back every setting individually
+        """
+        status = int(self._query("*ESR?"))
+        assert not status & self.ESR_ERROR_BITS, (
+            f"{self.name} reported an error while executing commands "
+            f"(Event Status Register: {status})"
+        )
+
     def query_id(self) -> str:
         """
-        Queries the device's ID string and returns it
+        Queries the device's ID string and returns it. The response can't
+        change while connected so it is only queried once per connection
         """
-        return self._query("*IDN?")
+        if self.idn is None:
+            self.idn = self._query("*IDN?")
+        return self.idn
 
     def reset(self):
         """
         Resets the device and clears all errors
         """
-        self._write("*RST")
-        # Wait for reset to complete
-        sleep(1)
-        while self._query("*OPC?") == "0":
-            pass
+        try:
+            self._reset_and_wait_for_srq()
+        except NotImplementedError:
+            # Service requests aren't supported over this connection
+            self._reset_and_poll()
         self._write("*CLS")
 
-    def _write(self, x: str, acquireLock: bool = True):
+    def _reset_and_wait_for_srq(self):
         """
-        Blocks until device is available, then writes to the device
+        Resets the device and blocks until it raises a service request
+        to say the reset has completed. The Operation Complete bit is
+        routed to the Service Request via the Event Status Bit.
 
-        acquireLock specifys whether this function should
-        acquire the lock itself (e.g. when used with query,
-        the lock will have already been acquired)
+        Raises NotImplementedError if the connection doesn't support
+        service requests
         """
-        if acquireLock:
-            self.lock.acquire()
-            try:
-                self.dev.write(x)
-            finally:
-                self.lock.release()
+        try:
+            self.dev.enable_event(EventType.service_request, EventMechanism.queue)
+        except (VisaIOError, NotImplementedError):
+            raise NotImplementedError
+
+        try:
+            self._write_batch(["*CLS", "*ESE 1", "*SRE 32", "*RST", "*OPC"])
+            self.dev.wait_on_event(
+                EventType.service_request, int(self.RESET_TIMEOUT * 1000)
+            )
+        except VisaIOError as e:
+            if e.error_code == StatusCode.error_timeout:
+                raise TimeoutError(
+                    f"{self.name} did not complete reset within "
+                    f"{self.RESET_TIMEOUT}s"
+                )
+            raise
+        finally:
+            self.dev.disable_event(EventType.service_request, EventMechanism.queue)
+            self.dev.discard_events(EventType.service_request, EventMechanism.queue)
+
+        self._write_batch(["*SRE 0", "*ESE 0"])
+
+    def _reset_and_poll(self):
+        """
+        Resets the device and polls until the reset has completed
+        """
+        self._write("*RST")
+        # Wait for reset to complete, backing off between polls so we
+        # don't flood the instrument with queries
+        sleep(1)
+        deadline = monotonic() + self.RESET_TIMEOUT
+        delay = 0.01
+        while self._query("*OPC?") == "0":
+            if monotonic() > deadline:
+                raise TimeoutError(
+                    f"{self.name} did not complete reset within "
+                    f"{self.RESET_TIMEOUT}s"
+                )
+            sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+    def _raw_write(self, x: Union[str, bytes]):
+        """
+        Writes to the device. The caller must already hold self.lock.
+        If x is bytes it is sent as is, without being encoded or having
+        the write termination added
+        """
+        self.query_cache.clear()
+        if isinstance(x, bytes):
+            self.dev.write_raw(x)
         else:
             self.dev.write(x)
-        self.logger.debug(f"[{self.instrument_name}] SENT:  {x}")
+        self.logger.debug("[%s] SENT:  %s", self.instrument_name, x)
 
-    def _read(self, acquireLock: bool = True) -> str:
+    def _raw_read(self) -> str:
         """
-        Blocks until device is available, then reads a line
-        from the device
+        Reads a line from the device. The caller must already
+        hold self.lock
+        """
+        result = self.dev.read().strip()
+        self.logger.debug("[%s] RCVD: %s", self.instrument_name, result)
+        return result
 
-        acquireLock specifys whether this function should
-        acquire the lock itself (e.g. when used with query,
-        the lock will have already been acquired)
+    @contextmanager
+    def device_timeout(self, timeout: int):
         """
-        if acquireLock:
-            self.lock.acquire()
+        Within the block, the device uses a timeout of <timeout> ms and no
+        other thread can access it. The previous timeout is restored on
+        exit, even if a command fails
+        """
+        with self.lock:
+            dev = self.dev
+            old_timeout = dev.timeout
+            dev.timeout = timeout
             try:
-                result = self.dev.read().strip()
+                yield dev
             finally:
-                self.lock.release()
-        else:
-            result = self.dev.read().strip()
+                dev.timeout = old_timeout
 
-        self.logger.debug(f"[{self.instrument_name}] RCVD: {result}")
-        return result
+    @contextmanager
+    def batch(self):
+        """
+        Within the block, commands written by this thread are held back and
+        sent as compound commands when the block exits (or before anything
+        is read back from the device). Settings aren't read back one at a
+        time to verify them, instead if verify is set, the Event Status
+        Register is checked once at the end. Has no effect on instruments
+        that don't support compound commands
+        """
+        if not self.SUPPORTS_COMPOUND_COMMANDS:
+            yield self
+            return
+
+        assert self.batch_thread is None, "batch() blocks can't be nested"
+        verify = self.verify
+        if verify:
+            # The Event Status Register holds errors until it's read, so
+            # read it now so only errors from this batch's commands are
+            # caught by verify_batch(). Earlier errors are still in the
+            # error queue for the error monitor to report
+            self._query("*ESR?")
+        self.batch_thread = current_thread()
+        try:
+            yield self
+        finally:
+            self._flush_batch()
+            self.batch_thread = None
+        if verify:
+            self.verify_batch()
 
-    def _query(self, command: str) -> str:
+    @contextmanager
+    def deferred_verification(self):
         """
-        Writes "command" to the device and returns the response
+        Within the block, settings made by this thread through
+        verify_setting() aren't read back straight away. Instead, the final
+        value of each is read back when the block exits, saving a round trip
+        per setting in loops that change the same setting repeatedly
         """
-        self.lock.acquire()
+        assert (
+            self.deferred_verify_thread is None
+        ), "deferred_verification() blocks can't be nested"
+        self.deferred_verify_thread = current_thread()
         try:
-            self._write(command, acquireLock=False)
-            response = self._read(acquireLock=False)
+            yield self
         finally:
-            self.lock.release()
+            self.deferred_verify_thread = None
+            pending_verifications = self.pending_verifications
+            self.pending_verifications = {}
+        with self.lock:
+            for getter, expected in pending_verifications.items():
+                self._check_setting(getter, expected)
+
+    def verify_setting(self, getter, expected) -> bool:
+        """
+        Checks that <getter>() returns <expected>, or records it to check
+        later if in a deferred_verification() block. Returns True if the
+        setting was checked now, False if the check was deferred
+        """
+        if self.deferred_verify_thread is current_thread():
+            self.pending_verifications[getter] = expected
+            return False
+        self._check_setting(getter, expected)
+        return True
+
+    def _check_setting(self, getter, expected):
+        actual = getter()
+        assert actual == expected, (
+            f"{self.name}: {getter.__name__}() returned {actual}, "
+            f"expected {expected}"
+        )
+
+    def _flush_batch(self):
+        """
+        Sends any commands held back by batch()
+        """
+        if self.pending_writes:
+            pending_writes = self.pending_writes
+            self.pending_writes = []
+            self._write_batch(pending_writes)
+
+    def _write(self, x: str):
+        """
+        Blocks until device is available, then writes to the device
+        """
+        if self.batch_thread is current_thread():
+            self.query_cache.clear()
+            self.pending_writes.append(x)
+            return
+        with self.lock:
+            self._raw_write(x)
+
+    def _write_batch(self, commands: List[str]):
+        """
+        Writes a list of commands to the device, combined into as few
+        compound commands as possible. Commands that aren't common (*)
+        commands are sent from the root of the command tree, as if each
+        was written on its own. Instruments that don't support compound
+        commands get each command written separately
+        """
+        if not self.SUPPORTS_COMPOUND_COMMANDS:
+            with self.lock:
+                for command in commands:
+                    self._raw_write(command)
+            return
+
+        messages = []
+        message = ""
+        for command in commands:
+            if not command.startswith(("*", ":")):
+                command = ":" + command
+            if message and len(message) + len(command) + 1 > self.MAX_MESSAGE_LENGTH:
+                messages.append(message)
+                message = command
+            else:
+                message = f"{message};{command}" if message else command
+        if message:
+            messages.append(message)
+
+        with self.lock:
+            for message in messages:
+                self._raw_write(message)
+
+    def _read(self) -> str:
+        """
+        Blocks until device is available, then reads a line
+        from the device
+        """
+        if self.batch_thread is current_thread():
+            self._flush_batch()
+        with self.lock:
+            return self._raw_read()
+
+    def _query(self, command: str) -> str:
+        """
+        Writes "command" to the device and returns the response
+        """
+        if self.batch_thread is current_thread():
+            self._flush_batch()
+        with self.lock:
+            # Compound commands can change settings as well as query them
+            if not is_query_only(command):
+                self.query_cache.clear()
+            response = self.dev.query(command).strip()
+        # Lazy formatting so nothing is built unless debug logging is on
+        instrument_name = self.instrument_name
+        self.logger.debug("[%s] SENT:  %s", instrument_name, command)
+        self.logger.debug("[%s] RCVD: %s", instrument_name, response)
         return response
 
+    def _cached_query(self, command: str) -> str:
+        """
+        As _query() but for commands that only read back settings. The
+        response is reused until something is next written to the device,
+        or a query that also changes settings is sent.
+        Nothing is cached unless under software control only, as otherwise
+        settings could be changed from the front panel
+        """
+        try:
+            return self.query_cache[command]
+        except KeyError:
+            response = self._query(command)
+            if self.only_software_control:
+                self.query_cache[command] = response
+            return response
+
+    def _query_binary(
+        self, command: str, datatype: str = "f", is_big_endian: bool = False
+    ) -> list:
+        """
+        Writes "command" to the device and returns the binary block response
+        decoded as a list of values of type datatype (a struct format code)
+        """
+        if self.batch_thread is current_thread():
+            self._flush_batch()
+        with self.lock:
+            if not is_query_only(command):
+                self.query_cache.clear()
+            values = self.dev.query_binary_values(
+                command, datatype=datatype, is_big_endian=is_big_endian
+            )
+        instrument_name = self.instrument_name
+        self.logger.debug("[%s] SENT:  %s", instrument_name, command)
+        self.logger.debug("[%s] RCVD: %d values", instrument_name, len(values))
+        return values
+
     def wait_until_op_complete(self):
         """
         Blocks until current commmands have all been executed
@@ -1,4 +1,4 @@
-from time import sleep
+from typing import List
 
 from AutomatedTesting.Instruments.DigitalMultimeter.DigitalMultimeter import (
     DigitalMultimeter,
@@ -6,43 +6,91 @@ from AutomatedTesting.Instruments.DigitalMultimeter.DigitalMultimeter import (
 
 
 class Agilent34401A(DigitalMultimeter):
-    CONFIGURATION_DELAY = 0.5
+    SUPPORTS_COMPOUND_COMMANDS = True
 
+    # Configuration commands for the default range and resolution,
+    # which is how they're almost always called
+    CONF_DC_VOLTAGE_DEFAULT = "CONF:VOLT:DC DEF,DEF;*OPC?"
+    CONF_DC_CURRENT_DEFAULT = "CONF:CURR:DC DEF,DEF;*OPC?"
+    CONF_RESISTANCE_DEFAULT = "CONF:RES DEF,DEF;*OPC?"
+
+    MAX_STORED_READINGS = 512
+
+    # Longest time (in seconds) a reading takes at the default resolution
+    # (10 PLC with autozero, at 50Hz), used to size the FETC? timeout
+    MAX_READING_TIME = 0.5
+
+    # Number of readings started by the last start_dc_voltage_samples()
+    sample_count = 0
+
+    def reset(self):
+        # Reset, clear errors and wait for completion in one transaction
+        self._query("*RST;*CLS;*OPC?")
+
+    # Wait for the change of control to be acknowledged rather
+    # than a fixed delay
     def set_remote_control(self):
-        self._write(":SYST:REM")
-        sleep(1)
+        self._query(":SYST:REM;*OPC?")
 
     def set_local_control(self):
-        self._write(":SYST:LOC")
-        sleep(1)
+        self._query(":SYST:LOC;*OPC?")
 
-    def measure_dc_voltage(self) -> float:
-        return float(self._query("MEAS:VOLT:DC? DEF,DEF"))
+    def measure_dc_voltage(self, range="DEF", resolution="DEF") -> float:
+        return float(self._query(f"MEAS:VOLT:DC? {range},{resolution}"))
 
-    def measure_dc_current(self) -> float:
-        return float(self._query("MEAS:CURR:DC? 1,DEF"))
+    def measure_dc_current(self, range=1, resolution="DEF") -> float:
+        return float(self._query(f"MEAS:CURR:DC? {range},{resolution}"))
 
-    def measure_resistance(self) -> float:
-        return float(self._query("MEAS:RES?"))
+    def measure_resistance(self, range="DEF", resolution="DEF") -> float:
+        return float(self._query(f"MEAS:RES? {range},{resolution}"))
 
     def measure_diode_voltage(self) -> float:
         return float(self._query("MEAS:DIOD?"))
 
+    # Configuration commands are followed by *OPC? in the same transaction
+    # so they return as soon as the meter is ready, rather than after a
+    # fixed delay
     def configure_dc_voltage(self, range="DEF", resolution="DEF"):
-        self._write(f"CONF:VOLT:DC {range},{resolution}")
-        sleep(self.CONFIGURATION_DELAY)
+        if range == "DEF" and resolution == "DEF":
+            self._query(self.CONF_DC_VOLTAGE_DEFAULT)
+        else:
+            self._query(f"CONF:VOLT:DC {range},{resolution};*OPC?")
 
     def configure_dc_current(self, range="DEF", resolution="DEF"):
-        self._write(f"CONF:CURR:DC {range},{resolution}")
-        sleep(self.CONFIGURATION_DELAY)
+        if range == "DEF" and resolution == "DEF":
+            self._query(self.CONF_DC_CURRENT_DEFAULT)
+        else:
+            self._query(f"CONF:CURR:DC {range},{resolution};*OPC?")
 
     def configure_resistance(self, range="DEF", resolution="DEF"):
-        self._write(f"CONF:RES {range},{resolution}")
-        sleep(self.CONFIGURATION_DELAY)
+        if range == "DEF" and resolution == "DEF":
+            self._query(self.CONF_RESISTANCE_DEFAULT)
+        else:
+            self._query(f"CONF:RES {range},{resolution};*OPC?")
 
     def configure_diode_voltage(self):
-        self._write(f"CONF:DIOD")
-        sleep(self.CONFIGURATION_DELAY)
+        self._query("CONF:DIOD;*OPC?")
 
     def measure_value(self) -> float:
         return float(self._query("READ?"))
+
+    def start_dc_voltage_samples(self, count: int, range="DEF", resolution="DEF"):
+        # Configure and trigger in one go so the readings are taken without
+        # any further bus traffic. Returns straight away, the readings are
+        # collected later by fetch_samples()
+        assert 1 <= count <= self.MAX_STORED_READINGS
+        self._write(
+            f"CONF:VOLT:DC {range},{resolution};:SAMP:COUN {count};"
+            ":TRIG:SOUR IMM;:INIT"
+        )
+        self.sample_count = count
+
+    def fetch_samples(self) -> List[float]:
+        # FETC? doesn't respond until all the readings have been taken, so
+        # allow for however many are still to come
+        timeout = self.dev.timeout
+        if timeout is not None:
+            timeout += int(self.sample_count * self.MAX_READING_TIME * 1000)
+        with self.device_timeout(timeout):
+            data = self._query("FETC?")
+        return [float(x) for x in data.split(",")]
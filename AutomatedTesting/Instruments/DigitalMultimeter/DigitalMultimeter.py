@@ -1,5 +1,19 @@
+from typing import List
+
 from AutomatedTesting.Instruments.EntireInstrument import EntireInstrument
 
 
 class DigitalMultimeter(EntireInstrument):
-    pass
+    def start_dc_voltage_samples(self, count: int, range="DEF", resolution="DEF"):
+        """
+        Configures for DC voltage and starts taking <count> readings
+        into the instrument's memory, to be collected by fetch_samples()
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    def fetch_samples(self) -> List[float]:
+        """
+        Waits for the readings started by start_dc_voltage_samples()
+        and returns them all
+        """
+        raise NotImplementedError  # pragma: no cover
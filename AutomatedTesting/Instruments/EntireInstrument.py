@@ -35,7 +35,6 @@ class EntireInstrument(BaseInstrument):
             **kwargs,
         )
         self.reserved = False  # Whether this instrument is in use
-        self.name = self.name
 
         # Used to remember previous freq to avoid continually updating it
         self.centreFreq = 0
@@ -49,10 +48,10 @@ class EntireInstrument(BaseInstrument):
         assert self.reserved is False, "Attempted to reserve a reserved device"
         self.name = purpose
         self.reserved = True
-        self.logger.info(f"{self.name} reserved as {self.name}")
+        self.logger.info(f"{self.instrument_name} reserved as {self.name}")
 
     def free(self):
         assert self.reserved
-        self.logger.debug(f"{self.name} freed from role as {self.name}")
+        self.logger.debug(f"{self.instrument_name} freed from role as {self.name}")
         self.name = self.instrument_name
         self.reserved = False
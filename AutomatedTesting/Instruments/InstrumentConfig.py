@@ -1,8 +1,11 @@
 import logging
 import signal
+import statistics
 import sys
 import time
-from typing import Dict
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List
 
 from pyvisa import ResourceManager
 from pyvisa.constants import StopBits
@@ -83,6 +86,7 @@ dmm = Agilent34401A(
     verify=True,
     logger=logger,
     stop_bits=StopBits.two,
+    read_termination="\r\n",
 )
 
 psu2 = Tenma_72_2535(
@@ -144,12 +148,78 @@ def check_online_instruments(instrument_list: list[BaseInstrument]) -> Dict[str,
     """
     Returns a dictionary of instrument name to status
     (True means responding to connections)
+    Instruments are tested concurrently so an offline instrument's
+    timeout doesn't hold up the rest
     """
-    status_dict = {}
-    for instrument in instrument_list:
-        status_dict[instrument.name] = instrument.test_connection()
 
-    return status_dict
+    def test_instrument(instrument: BaseInstrument) -> bool:
+        try:
+            return instrument.test_connection()
+        except Exception:
+            logger.exception(f"Failed to test connection to {instrument.name}")
+            return False
+
+    if not instrument_list:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=len(instrument_list)) as executor:
+        results = executor.map(test_instrument, instrument_list)
+        return {x.name: status for x, status in zip(instrument_list, results)}
+
+
+def monitor_online_instruments(
+    instrument_list: List[BaseInstrument], period: float = 2
+):
+    """
+    Prints the status of each instrument in instrument_list every period
+    seconds, forever. Polls are scheduled from a fixed start time so the
+    time taken by each poll doesn't make the period drift. Timings of
+    recent polls are logged so slow polls are visible
+    """
+    poll_times = deque(maxlen=100)
+    next_poll = time.monotonic()
+    while True:
+        start = time.monotonic()
+        print(check_online_instruments(instrument_list))
+        poll_times.append(time.monotonic() - start)
+        if len(poll_times) > 1:
+            percentiles = statistics.quantiles(poll_times, n=20)
+            logger.debug(
+                f"Instrument poll took {poll_times[-1] * 1000:.0f}ms "
+                f"(p50 {percentiles[9] * 1000:.0f}ms, "
+                f"p95 {percentiles[18] * 1000:.0f}ms)"
+            )
+
+        next_poll += period
+        delay = next_poll - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            # Overran, start again from now rather than trying to catch up
+            logger.warning(f"Instrument poll overran {period}s period")
+            next_poll = time.monotonic()
+
+
+def initialise_instruments(instrument_list: List[BaseInstrument]):
+    """
+    Initialises all instruments in instrument_list concurrently, so the
+    total time is that of the slowest instrument rather than the sum.
+    If any fail, the instruments that did initialise are cleaned up and
+    the first error is raised
+    """
+    if not instrument_list:
+        return
+
+    with ThreadPoolExecutor(max_workers=len(instrument_list)) as executor:
+        futures = [executor.submit(x.initialise) for x in instrument_list]
+        wait(futures)
+
+    errors = [x.exception() for x in futures if x.exception()]
+    if errors:
+        for instrument, future in zip(instrument_list, futures):
+            if future.exception() is None:
+                instrument.cleanup()
+        raise errors[0]
 
 
 # Attach handler to signal thrown by any error monitoring thread
@@ -165,9 +235,7 @@ def main():
     with scope:
         time.sleep(1)
     # instrument_list = [sdg2122x, u2001a, e4433b, dmm, psu2, psu3]
-    # while True:
-    #     print(check_online_instruments(instrument_list))
-    #     time.sleep(2)
+    # monitor_online_instruments(instrument_list)
 
 
 if __name__ == "__main__":
@@ -1,15 +1,15 @@
 import logging
-import os
-import signal
-from multiprocessing import Process
 from time import sleep
+from typing import Dict, List, Tuple
 
 from pyvisa import ResourceManager
 
-from AutomatedTesting.Instruments.BaseInstrument import BaseInstrument
+from AutomatedTesting.Instruments.BaseInstrument import BaseInstrument, error_monitor
 
 
 class InstrumentChannel:
+    __slots__ = ("instrument", "name", "channel_number", "logger", "reserved")
+
     def __init__(
         self,
         channel_number: int,
@@ -19,6 +19,8 @@ class InstrumentChannel:
         """
         Channel Number is 1-indexed because I'm human
         """
+        if channel_number < 1:
+            raise ValueError(f"Channel number must be 1 or more, not {channel_number}")
         # Channel objects get created before the instrument
         # they're assigned to so have to set as None and override later
         self.instrument = instrument
@@ -28,11 +30,6 @@ class InstrumentChannel:
 
         self.reserved = False
 
-        self.name = None
-        self.monitor_process = Process(
-            target=self.check_channel_errors, args=[os.getpid()], daemon=True
-        )
-
     def _reserve(self, purpose: str):
         assert (
             self.reserved is False
@@ -45,50 +42,23 @@ class InstrumentChannel:
 
     def free(self):
         assert self.reserved, "Attempeted to free an already free channel"
-        if self.monitor_process.is_alive():
-            self.monitor_process.terminate()
-            self.monitor_process.join(2)
+        self.instrument.stop_monitoring_channel(self)
         oldName = self.name
         self.name = f"{self.instrument.name} - Channel {self.channel_number}"
         self.reserved = False
         self.logger.debug(f"{self.name} released from role as {oldName}")
 
-    def check_channel_errors(self, pid: int):
-        """
-        Checks for channel specific errors, raises a signal to thread with Process
-        ID pid in case of an error
-        """
-        self.logger.debug(f"Started error monitoring thread for {self.name}")
-        while True:
-            sleep(3)
-            errorList = self.instrument.get_channel_errors(self.channel_number)
-            if errorList:
-                for errorCode, errorMessage in errorList:
-                    self.logger.error(
-                        f"{self.name} reporting error "
-                        f"{errorCode} ({errorMessage}). Shutting down..."
-                    )
-
-                # Inform main thread
-                os.kill(pid, signal.SIGUSR1)
-
     def set_output_enabled_state(self, enabled: bool = True):
         if enabled:
-            assert self.monitor_process.is_alive() is False and self.reserved
+            assert (
+                self not in self.instrument.monitored_channels and self.reserved
+            )
             self.instrument.enable_channel_output(self.channel_number)
             sleep(0.5)  # Allow a small amount of time for inrush current
-            self.monitor_process = Process(
-                target=self.check_channel_errors, args=[os.getpid()], daemon=True
-            )
-            self.monitor_process.start()
+            self.instrument.monitor_channel(self)
             self.logger.debug(f"{self.name} - Output Enabled")
         else:
-            if self.monitor_process and self.monitor_process.is_alive():
-                try:
-                    self.monitor_process.terminate()
-                    self.monitor_process.join()
-                except AttributeError:
-                    pass
+            self.instrument.stop_monitoring_channel(self)
             self.instrument.disable_channel_output(self.channel_number)
             self.logger.debug(f"{self.name} - Output Disabled")
 
@@ -140,33 +110,110 @@ class MultichannelInstrument(BaseInstrument):
         )
 
         assert len(channels) == channel_count
-        expected_channels = list(range(1, channel_count + 1))
-        found_channels = [x.channel_number for x in channels]
-        assert expected_channels == found_channels
+        assert all(
+            x.channel_number == i for i, x in enumerate(channels, start=1)
+        ), "Channels must be numbered 1 to channel_count in order"
 
         self.channels = channels
         self.channel_count = channel_count
+        # Channels with their output enabled, checked for errors along
+        # with the rest of the instrument
+        self.monitored_channels = []
 
     def __enter__(self):
         self.initialise()
 
     def initialise(self):
+        self.monitored_channels = []
         super().initialise()
         for x in self.channels:
             x.instrument = self
             x.name = f"{self.name} - Channel {x.channel_number}"
             if self.only_software_control:
                 x.disable_output()
+        if not self.error_monitored:
+            # Channels enabled under interactive control still need
+            # checking for errors
+            error_monitor.register(self)
+            self.error_monitored = True
         return self
 
     def __exit__(self, *args, **kwargs):
         self.cleanup()
 
     def cleanup(self):
+        try:
+            if self.only_software_control:
+                # Turn all channels off in as few transactions as possible
+                with self.batch():
+                    for x in self.channels:
+                        x.cleanup()
+        except AssertionError:
+            # A failed verification mustn't stop the connection being closed
+            self.logger.exception(f"{self.name}: Failed to verify channels off")
+        finally:
+            super().cleanup()
+
+    def check_instrument_errors(self):
+        """
+        Called periodically from the error monitoring thread. Checks the
+        instrument (if under software control) and all monitored channels
+        """
         if self.only_software_control:
-            for x in self.channels:
-                x.cleanup()
-        super().cleanup()
+            super().check_instrument_errors()
+        self.check_all_channel_errors()
+
+    def monitor_channel(self, channel: InstrumentChannel):
+        """
+        Starts checking channel for errors
+        """
+        with self.lock:
+            self.monitored_channels.append(channel)
+
+    def stop_monitoring_channel(self, channel: InstrumentChannel):
+        """
+        Stops checking channel for errors. Blocks until any check
+        currently being made has finished, as the error monitor holds the
+        instrument's lock while checking it
+        """
+        with self.lock:
+            if channel in self.monitored_channels:
+                self.monitored_channels.remove(channel)
+
+    def check_all_channel_errors(self):
+        """
+        Checks all monitored channels for errors and reports any
+        to the error monitor
+        """
+        if not self.monitored_channels:
+            return
+
+        for channel_number, error_list in self.get_all_channel_errors().items():
+            if not error_list:
+                continue
+            channel = self.channels[channel_number - 1]
+            for code, message in error_list:
+                channel.logger.error(
+                    f"{channel.name} reporting error "
+                    f"{code} ({message}). Shutting down..."
+                )
+            error_monitor.report_errors(channel.name, error_list)
+
+    def get_all_channel_errors(self) -> Dict[int, List[Tuple[int, str]]]:
+        """
+        Returns the errors on each monitored channel, keyed by channel
+        number. The channels are all read in one go without other threads
+        getting access to the instrument in between. Instruments that can
+        report every channel's status in a single query should override this
+        """
+        with self.lock:
+            return {
+                x.channel_number: self.get_channel_errors(x.channel_number)
+                for x in self.monitored_channels
+            }
+
+    def get_channel_errors(self, channel_number: int) -> List[Tuple[int, str]]:
+        raise NotImplementedError  # pragma: no cover
 
     def set_channel_output_enabled_state(self, channel_number: int, enabled: bool):
         raise NotImplementedError
@@ -181,7 +228,8 @@ class MultichannelInstrument(BaseInstrument):
         self.set_channel_output_enabled_state(channel_number, False)
 
     def validate_channel_number(self, number: int):
-        assert number in list(range(1, self.channel_count + 1))
+        if not 1 <= number <= self.channel_count:
+            raise ValueError(f"Channel {number} out of range for {self.name}")
 
     def reserve_channel(self, channel_number: int, purpose: str) -> InstrumentChannel:
         self.validate_channel_number(channel_number)
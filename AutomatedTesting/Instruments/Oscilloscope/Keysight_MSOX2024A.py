@@ -7,7 +7,7 @@ from AutomatedTesting.Instruments.Oscilloscope.Oscilloscope import (
     OscilloscopeChannel,
 )
 
-ALLOWED_VOLTS_PER_DIV = [
+ALLOWED_VOLTS_PER_DIV = (
     10e-3,
     20e-3,
     50e-3,
@@ -20,10 +20,33 @@ ALLOWED_VOLTS_PER_DIV = [
     10,
     20,
     50,
-]
+)
+
+
+class Keysight_MSOX2024A_Channel(OscilloscopeChannel):
+    __slots__ = ()
+    allowed_volts_per_div = ALLOWED_VOLTS_PER_DIV
 
 
 class Keysight_MSOX2024A(Oscilloscope):
+    SUPPORTS_COMPOUND_COMMANDS = True
+
+    # Fixed commands for each channel, built once rather than on every call.
+    # Keyed by channel number so an invalid one raises KeyError rather than
+    # picking another channel. Setting commands are indexed by
+    # [channel_number][enabled]
+    COUPLING_COMMANDS = {
+        i: (f":CHAN{i}:COUP AC", f":CHAN{i}:COUP DC") for i in range(1, 5)
+    }
+    COUPLING_QUERIES = {i: f":CHAN{i}:COUP?" for i in range(1, 5)}
+    DISPLAY_COMMANDS = {
+        i: (f":CHAN{i}:DISP 0", f":CHAN{i}:DISP 1") for i in range(1, 5)
+    }
+    DISPLAY_QUERIES = {i: f":CHAN{i}:DISP?" for i in range(1, 5)}
+    RMS_QUERIES = {i: f":MEAS:VRMS? CYCL,DC,CHAN{i}" for i in range(1, 5)}
+    RANGE_QUERIES = {i: f":CHAN{i}:RANG?" for i in range(1, 5)}
+    SCALE_QUERIES = {i: f":CHAN{i}:SCAL?" for i in range(1, 5)}
+
     def __init__(
         self,
         resource_manager: ResourceManager,
@@ -43,37 +66,33 @@ class Keysight_MSOX2024A(Oscilloscope):
             verify=verify,
             channel_count=4,
             channels=[
-                OscilloscopeChannel(
+                Keysight_MSOX2024A_Channel(
                     channel_number=1,
                     instrument=self,
                     logger=logger,
                     max_voltage=200,
                     max_frequency=200e6,
-                    allowed_volts_per_div=ALLOWED_VOLTS_PER_DIV,
                 ),
-                OscilloscopeChannel(
+                Keysight_MSOX2024A_Channel(
                     channel_number=2,
                     instrument=self,
                     logger=logger,
                     max_voltage=200,
                     max_frequency=200e6,
-                    allowed_volts_per_div=ALLOWED_VOLTS_PER_DIV,
                 ),
-                OscilloscopeChannel(
+                Keysight_MSOX2024A_Channel(
                     channel_number=3,
                     instrument=self,
                     logger=logger,
                     max_voltage=200,
                     max_frequency=200e6,
-                    allowed_volts_per_div=ALLOWED_VOLTS_PER_DIV,
                 ),
-                OscilloscopeChannel(
+                Keysight_MSOX2024A_Channel(
                     channel_number=4,
                     instrument=self,
                     logger=logger,
                     max_voltage=200,
                     max_frequency=200e6,
-                    allowed_volts_per_div=ALLOWED_VOLTS_PER_DIV,
                 ),
             ],
             logger=logger,
@@ -82,26 +101,26 @@ class Keysight_MSOX2024A(Oscilloscope):
         )
 
     def set_channel_input_coupling(self, channel_number: int, dc_coupling: bool):
-        self._write(f":CHAN{channel_number}:COUP {'DC' if dc_coupling else 'AC'}")
+        self._write(self.COUPLING_COMMANDS[channel_number][dc_coupling])
 
     def get_channel_input_coupling(self, channel_number: int) -> bool:
         """
         Returns True if channel is DC coupled
         """
-        return self._query(f":CHAN{channel_number}:COUP?") == "DC"
+        return self._cached_query(self.COUPLING_QUERIES[channel_number]) == "DC"
 
     def set_channel_display_enabled_state(self, channel_number: int, enabled: bool):
-        self._write(f":CHAN{channel_number}:DISP {'1' if enabled else '0'}")
+        self._write(self.DISPLAY_COMMANDS[channel_number][enabled])
 
     def get_channel_display_enabled_state(self, channel_number: int) -> bool:
-        return self._query(f":CHAN{channel_number}:DISP?") == "1"
+        return self._cached_query(self.DISPLAY_QUERIES[channel_number]) == "1"
 
     def measure_channel_rms_voltage(self, channel_number: int) -> float:
-        x = float(self._query(f":MEAS:VRMS? CYCL,DC,CHAN{channel_number}"))
+        x = float(self._query(self.RMS_QUERIES[channel_number]))
         if x == 9.9e37:
             return float("inf")
         else:
-            return float(x)
+            return x
 
     def set_timebase_scale(self, seconds_per_div: float):
         self._write(f":TIM:SCAL {seconds_per_div}")
@@ -109,16 +128,16 @@ class Keysight_MSOX2024A(Oscilloscope):
             assert self.get_timebase_scale() == seconds_per_div
 
     def get_timebase_scale(self) -> float:
-        return float(self._query(":TIM:SCAL?"))
+        return float(self._cached_query(":TIM:SCAL?"))
 
     def set_channel_voltage_range(self, channel_number: int, voltage_range: float):
         self._write(f":CHAN{channel_number}:RANG {voltage_range}")
 
     def get_channel_voltage_range(self, channel_number: int) -> float:
-        return float(self._query(f":CHAN{channel_number}:RANG?"))
+        return float(self._cached_query(self.RANGE_QUERIES[channel_number]))
 
     def set_channel_voltage_scale(self, channel_number: int, volts_per_div: float):
         self._write(f":CHAN{channel_number}:SCAL {volts_per_div}")
 
     def get_channel_voltage_scale(self, channel_number: int) -> float:
-        return float(self._query(f":CHAN{channel_number}:SCAL?"))
+        return float(self._cached_query(self.SCALE_QUERIES[channel_number]))
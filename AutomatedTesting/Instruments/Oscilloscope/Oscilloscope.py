@@ -1,4 +1,6 @@
 import logging
+from bisect import bisect_left
+from typing import Tuple
 
 from AutomatedTesting.Instruments.MultichannelInstrument import (
     InstrumentChannel,
@@ -7,6 +9,17 @@ from AutomatedTesting.Instruments.MultichannelInstrument import (
 
 
 class OscilloscopeChannel(InstrumentChannel):
+    __slots__ = (
+        "max_voltage",
+        "max_frequency",
+        "cached_dc_coupling",
+        "cached_display_enabled",
+    )
+
+    # Supported Volts per division settings, in ascending order.
+    # Shared by all channels so set by the subclass for each instrument
+    allowed_volts_per_div: Tuple[float, ...] = ()
+
     def __init__(
         self,
         channel_number: int,
@@ -14,11 +27,14 @@ class OscilloscopeChannel(InstrumentChannel):
         logger: logging.Logger,
         max_voltage: float,
         max_frequency: float,
-        allowed_volts_per_div: list[float],
     ):
         self.max_voltage = max_voltage
         self.max_frequency = max_frequency
-        self.allowed_volts_per_div = allowed_volts_per_div
+        # Last coupling / display state set under software control, so
+        # repeated requests for the same state don't go to the instrument.
+        # None if unknown
+        self.cached_dc_coupling = None
+        self.cached_display_enabled = None
         super().__init__(
             channel_number=channel_number, instrument=instrument, logger=logger
         )
@@ -40,11 +56,17 @@ class OscilloscopeChannel(InstrumentChannel):
         pass
 
     def set_input_coupling(self, dc_coupling: bool = False):
+        if (
+            self.instrument.only_software_control
+            and self.cached_dc_coupling == dc_coupling
+        ):
+            return
         self.instrument.set_channel_input_coupling(
             channel_number=self.channel_number, dc_coupling=dc_coupling
         )
         if self.instrument.verify:
             assert self.get_input_coupling() == dc_coupling
+        self.cached_dc_coupling = dc_coupling
 
     def get_input_coupling(self) -> bool:
         """
@@ -65,9 +87,23 @@ class OscilloscopeChannel(InstrumentChannel):
         """
         En/disables the channel on the oscilloscope
         """
+        if (
+            self.instrument.only_software_control
+            and self.cached_display_enabled == enabled
+        ):
+            return
         self.instrument.set_channel_display_enabled_state(self.channel_number, enabled)
         if self.instrument.verify:
             assert self.get_display_enabled_state() == enabled
+        self.cached_display_enabled = enabled
+
+    def clear_cached_state(self):
+        """
+        Forgets the coupling / display state, e.g. after the instrument
+        has been reset
+        """
+        self.cached_dc_coupling = None
+        self.cached_display_enabled = None
 
     def get_display_enabled_state(self) -> bool:
         """
@@ -99,12 +135,20 @@ class OscilloscopeChannel(InstrumentChannel):
         """
         Returns full scale range in Volts
         """
-        return float(self.instrument.get_channel_voltage_range(self.channel_number))
+        return self.instrument.get_channel_voltage_range(self.channel_number)
 
     def set_voltage_scale(self, volts_per_div: float):
         """
         Sets Volts per division
         """
+        allowed = self.allowed_volts_per_div
+        if allowed:
+            i = bisect_left(allowed, volts_per_div)
+            if i == len(allowed) or allowed[i] != volts_per_div:
+                raise ValueError(
+                    f"{volts_per_div}V/div not supported by {self.name}. "
+                    f"Supported values: {allowed}"
+                )
         self.instrument.set_channel_voltage_scale(self.channel_number, volts_per_div)
         if self.instrument.verify:
             assert self.get_voltage_scale() == volts_per_div
@@ -113,16 +157,19 @@ class OscilloscopeChannel(InstrumentChannel):
         """
         Returns Volts per division
         """
-        return float(self.instrument.get_channel_voltage_scale(self.channel_number))
+        return self.instrument.get_channel_voltage_scale(self.channel_number)
 
 
 class Oscilloscope(MultichannelInstrument):
     def initialise(self):
+        for x in self.channels:
+            x.clear_cached_state()
         super().initialise()
         if self.only_software_control:
-            for x in self.channels:
-                x.disable_display()
-                x.set_input_coupling_ac()
+            with self.batch():
+                for x in self.channels:
+                    x.disable_display()
+                    x.set_input_coupling_ac()
 
     def set_channel_input_coupling(self, channel_number: int, dc_coupling: bool):
         raise NotImplementedError
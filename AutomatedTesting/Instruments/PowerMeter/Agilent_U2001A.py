@@ -1,3 +1,4 @@
+import math
 from logging import Logger
 
 from pyvisa import ResourceManager
@@ -7,6 +8,13 @@ from AutomatedTesting.Misc.UsefulFunctions import readable_freq
 
 
 class Agilent_U2001A(PowerMeter):
+    SUPPORTS_COMPOUND_COMMANDS = True
+
+    # Largest difference (in Hz) between the frequency sent and the one
+    # read back for the setting to count as verified, as the readback is
+    # a float echoed by the instrument rather than the value sent
+    FREQ_TOLERANCE = 1
+
     def __init__(
         self,
         resource_manager: ResourceManager,
@@ -35,12 +43,13 @@ class Agilent_U2001A(PowerMeter):
 
     def initialise(self):
         super().initialise()
+        # Frequency is unknown after a reset
+        self.centreFreq = 0
         self._write("INIT:CONT ON")
         return self
 
     def internal_zero(self):
-        self._write("CAL:ZERO:TYPE INT")
-        self._zero()
+        self._zero("INT")
         self.logger.info(f"{self.name} zeroed internally")
 
     def external_zero(self):
@@ -49,8 +58,7 @@ class Agilent_U2001A(PowerMeter):
             f"Please disconnect input from {self.name} and press "
             "any key to continue..."
         )
-        self._write("CAL:ZERO:TYPE EXT")
-        self._zero()
+        self._zero("EXT")
         self.logger.info(f"{self.name} zeroed externally")
         self.logger.debug(f"{self.name}: Waiting for user intervention on zeroing")
         input(
@@ -59,9 +67,15 @@ class Agilent_U2001A(PowerMeter):
 
     def set_freq(self, freq):
         assert self.reserved
+        if self.only_software_control and freq == self.centreFreq:
+            # Already set and verified, no need to go to the instrument
+            return
         self._write(f"FREQ {readable_freq(freq)}")
         if self.verify:
-            assert self.get_freq() == freq
+            readback = self.get_freq()
+            assert math.isclose(readback, freq, abs_tol=self.FREQ_TOLERANCE), (
+                f"{self.name}: frequency read back as {readback}, expected {freq}"
+            )
         self.centreFreq = freq
 
     def get_freq(self) -> float:
@@ -69,22 +83,37 @@ class Agilent_U2001A(PowerMeter):
 
     def measure_power(self, freq: float) -> float:
         assert self.reserved
-        if freq != self.centreFreq:
-            self.set_freq(freq)
-        timeout = self.dev.timeout
-        self.dev.timeout = 0
-        x = float(self._query("MEAS? DEF, 3, (@1)"))
-        self.dev.timeout = timeout
-        return x
-
-    def _zero(self):
+        command = "MEAS? DEF, 3, (@1)"
+        freq_changed = freq != self.centreFreq
+        if freq_changed:
+            # Set the frequency (and read it back if verifying) in the
+            # same transaction as the measurement
+            if self.verify:
+                command = f"FREQ {readable_freq(freq)};:FREQ?;:{command}"
+            else:
+                command = f"FREQ {readable_freq(freq)};:{command}"
+        with self.device_timeout(0):
+            response = self._query(command)
+
+        if freq_changed and self.verify:
+            readback, response = response.split(";")
+            readback = float(readback)
+            assert math.isclose(readback, freq, abs_tol=self.FREQ_TOLERANCE), (
+                f"{self.name}: frequency read back as {readback}, expected {freq}"
+            )
+        if freq_changed:
+            self.centreFreq = freq
+        return float(response)
+
+    def _zero(self, zero_type: str):
         """
         Internal helper function as internal and external zeroing
         uses the same comamand
+
+        Args:
+            zero_type (str): "INT" or "EXT"
         """
         self.logger.info(f"Calibrating {self.name}. This takes a while...")
-        x = self.dev.timeout
-        self.dev.timeout = 0
-        result = self._query("CAL?")
-        self.dev.timeout = x
+        with self.device_timeout(0):
+            result = self._query(f"CAL:ZERO:TYPE {zero_type};:CAL?")
         assert result != 0, f"Calibration of {self.name} failed. Return code: {result}"
@@ -1,5 +1,9 @@
 import logging
+from concurrent.futures import wait
+from time import monotonic
+from typing import Dict, List, Tuple
 
+from AutomatedTesting.Instruments.BaseInstrument import submit_instrument_io
 from AutomatedTesting.Instruments.MultichannelInstrument import (
     InstrumentChannel,
     MultichannelInstrument,
@@ -28,13 +32,47 @@ class PowerSupply(MultichannelInstrument):
         None
     """
 
+    # Time (in seconds) a status byte read is reused for, so checking the
+    # state and errors of several channels together only reads it once
+    STATUS_BYTE_TTL = 0.05
+
+    # Last status byte read and when, see _cached_status_byte()
+    status_byte = None
+    status_byte_time = None
+
     def initialise(self):
+        for x in self.channels:
+            x.last_verified_voltage = None
+            x.last_verified_current = None
         super().initialise()
         if self.only_software_control:
             for x in self.channels:
                 x.set_voltage(x.min_voltage)
                 x.set_current_limit(x.min_current)
 
+    def _write(self, x: str):
+        # Anything written could change the status
+        self.status_byte_time = None
+        super()._write(x)
+
+    def _cached_status_byte(self):
+        """
+        Returns the status byte, reusing the last one read if it was read
+        less than STATUS_BYTE_TTL seconds ago and nothing has been written
+        to the instrument since
+        """
+        now = monotonic()
+        if (
+            self.status_byte_time is None
+            or now - self.status_byte_time >= self.STATUS_BYTE_TTL
+        ):
+            self.status_byte = self._get_status_byte()
+            self.status_byte_time = now
+        return self.status_byte
+
+    def _get_status_byte(self):
+        raise NotImplementedError  # pragma: no cover
+
     def set_channel_voltage(self, channel_number, voltage):
         raise NotImplementedError  # pragma: no cover
 
@@ -92,6 +130,22 @@ class PowerSupplyChannel(InstrumentChannel):
             or channel_number > max channels for that PSU
     """
 
+    __slots__ = (
+        "absolute_max_voltage",
+        "absolute_min_voltage",
+        "max_voltage",
+        "min_voltage",
+        "absolute_max_current",
+        "absolute_min_current",
+        "max_current",
+        "min_current",
+        "overvoltage_protectionEnabled",
+        "ocpEnabled",
+        "outputEnabled",
+        "last_verified_voltage",
+        "last_verified_current",
+    )
+
     def __init__(
         self,
         channel_number: int,
@@ -122,6 +176,11 @@ class PowerSupplyChannel(InstrumentChannel):
         self.ocpEnabled = False
         self.outputEnabled = False
 
+        # Last setpoints written and read back successfully, so writing
+        # the same value again doesn't need reading back. None if unknown
+        self.last_verified_voltage = None
+        self.last_verified_current = None
+
         super().__init__(
             channel_number=channel_number, instrument=instrument, logger=logger
         )
@@ -230,10 +289,21 @@ class PowerSupplyChannel(InstrumentChannel):
                 f"Channel {self.channel_number}"
             )
 
+        already_verified = (
+            self.instrument.only_software_control
+            and self.last_verified_voltage == voltage
+        )
+        # Forget the last value until this one has been read back, so a
+        # failed or deferred check doesn't leave a stale value behind
+        self.last_verified_voltage = None
+
         self.instrument.set_channel_voltage(self.channel_number, voltage)
 
         if self.instrument.verify:
-            assert self.get_voltage() == voltage
+            if already_verified or self.instrument.verify_setting(
+                self.get_voltage, voltage
+            ):
+                self.last_verified_voltage = voltage
 
         self.logger.debug(
             f"{self.instrument.name}, " f"Channel {self.name} set to {voltage}V"
@@ -296,9 +366,17 @@ class PowerSupplyChannel(InstrumentChannel):
                 f"Power supply {self.instrument.name}, "
                 f"channel {self.channel_number}"
             )
+        already_verified = (
+            self.instrument.only_software_control
+            and self.last_verified_current == current
+        )
+        self.last_verified_current = None
         self.instrument.set_channel_current_limit(self.channel_number, current)
         if self.instrument.verify:
-            assert self.get_current_limit() == current
+            if already_verified or self.instrument.verify_setting(
+                self.get_current_limit, current
+            ):
+                self.last_verified_current = current
 
     def get_current_limit(self):
         """
@@ -333,3 +411,73 @@ class PowerSupplyChannel(InstrumentChannel):
 
     def get_output_enabled_state(self) -> bool:
         return self.instrument.get_channel_output_enabled_state(self.channel_number)
+
+    def sweep_voltage(self, voltages: List[float]) -> List[Tuple[float, float]]:
+        """
+        Sets channel output voltage to each of <voltages> in turn and
+        measures the output at each step. If verify is set, the setpoint
+        is only read back once, at the end, rather than at every step
+
+        Args:
+            voltages (List[float]): output voltages in Volts
+
+        Returns:
+            List[Tuple[float, float]]: measured output voltage (in Volts)
+                and current (in Amps) at each step
+
+        Raises:
+            ValueError: If any requested voltage is outside channel
+                max/min voltage
+            AssertionError: If readback voltage != final requested voltage
+        """
+        for voltage in voltages:
+            if not (self.min_voltage <= voltage <= self.max_voltage):
+                raise ValueError(
+                    f"Requested voltage of {voltage}V outside limits for "
+                    f"Power supply {self.instrument.name}, "
+                    f"Channel {self.channel_number}"
+                )
+
+        results = []
+        with self.instrument.deferred_verification():
+            for voltage in voltages:
+                self.set_voltage(voltage)
+                results.append((self.measure_voltage(), self.measure_current()))
+        return results
+
+
+def measure_channels(channels: List[PowerSupplyChannel]) -> List[Tuple[float, float]]:
+    """
+    Measures output voltage and current on each of <channels>, returning a
+    list of (voltage, current) in the same order. Each instrument's channels
+    are measured in turn (they share one connection), but different
+    instruments are measured concurrently so the total time is that of the
+    slowest instrument rather than the sum. Instruments on the same GPIB
+    bus are treated as one as they can't talk at the same time
+    """
+
+    def bus(channel: PowerSupplyChannel):
+        address = channel.instrument.visa_address
+        if address.upper().startswith("GPIB"):
+            return address.split("::")[0].upper()
+        return channel.instrument
+
+    groups: Dict[object, List[int]] = {}
+    for i, channel in enumerate(channels):
+        groups.setdefault(bus(channel), []).append(i)
+
+    results: List[Tuple[float, float]] = [None] * len(channels)
+
+    def measure_group(indices: List[int]):
+        for i in indices:
+            channel = channels[i]
+            # Hold the lock so voltage and current are read back to back
+            with channel.instrument.lock:
+                results[i] = (channel.measure_voltage(), channel.measure_current())
+
+    futures = [submit_instrument_io(measure_group, x) for x in groups.values()]
+    wait(futures)
+    # Re-raise the first exception from any of the measurements
+    for future in futures:
+        future.result()
+    return results
@@ -82,7 +82,7 @@ class Siglent_SPD3303X(PowerSupply):
         Raises:
             None
         """
-        self._write(f"CH{channel_number}:VOLT {round(voltage, 3)}")
+        self._write(f"CH{channel_number}:VOLT {voltage:.3f}")
 
     def get_channel_voltage(self, channel_number):
         """
@@ -131,7 +131,7 @@ class Siglent_SPD3303X(PowerSupply):
         Raises:
             None
         """
-        self._write(f"CH{channel_number}:CURR {round(current, 3)}")
+        self._write(f"CH{channel_number}:CURR {current:.3f}")
 
     def get_channel_current_limit(self, channel_number):
         """
@@ -171,19 +171,14 @@ class Siglent_SPD3303X(PowerSupply):
             sleep(1)
 
     def get_channel_output_enabled_state(self, channel_number: int) -> bool:
-        status = self._get_status_byte()
+        status = self._cached_status_byte()
         if channel_number == 1:
-            return status[self.CHANNEL1_STATUS] == "1"
+            return bool(status & (1 << self.CHANNEL1_STATUS))
         else:
-            return status[self.CHANNEL2_STATUS] == "1"
+            return bool(status & (1 << self.CHANNEL2_STATUS))
 
     def _get_status_byte(self) -> int:
-        # Get status byte and convert to string in reverse
-        # order so status[0] = bit 0
-        response = self._query("SYST:STATUS?")
-        status = int(response, 0)
-        status = format(status, "010b")[::-1]
-        return status
+        return int(self._query("SYST:STATUS?"), 0)
 
     def get_channel_errors(self, channel_number):
         return []
@@ -204,10 +199,10 @@ class Siglent_SPD3303X(PowerSupply):
         Raises:
             None
         """
-        status = self._get_status_byte()
+        status = self._cached_status_byte()
 
-        if (channel_number == 1 and status[self.CHANNEL1_MODE_BIT] == "1") or (
-            channel_number == 2 and status[self.CHANNEL2_MODE_BIT] == "1"
+        if (channel_number == 1 and status & (1 << self.CHANNEL1_MODE_BIT)) or (
+            channel_number == 2 and status & (1 << self.CHANNEL2_MODE_BIT)
         ):
             logging.error(
                 f"PSU: {self.name}, "
@@ -1,5 +1,5 @@
 import logging
-from time import sleep
+from time import monotonic, sleep
 
 from pyvisa import ResourceManager, VisaIOError
 
@@ -12,7 +12,8 @@ from AutomatedTesting.Instruments.PowerSupply.PowerSupply import (
 class Tenma_Generic(PowerSupply):
     """
     Class for Tenma PSUs
-    NB All the sleep() are really important
+    NB All the sleep() are really important, as is leaving
+    TRANSACTION_INTERVAL between transactions
 
     Args:
         address (str):
@@ -26,6 +27,21 @@ class Tenma_Generic(PowerSupply):
         None
     """
 
+    # Minimum time (in seconds) the PSU needs between transactions
+    TRANSACTION_INTERVAL = 0.1
+
+    # Gap (in ms) after which a response with no terminator is complete
+    INTER_BYTE_TIMEOUT = 50
+
+    # Setpoint commands, already encoded as the PSU has no write
+    # termination for pyvisa to add
+    VOLTAGE_SET_COMMAND = b"VSET%d:%.2f"
+    CURRENT_SET_COMMAND = b"ISET%d:%.3f"
+
+    # Bit masks for status byte
+    CHANNEL1_CV_MODE_MASK = 1 << 0  # Set in CV mode, clear in CC mode
+    OUTPUT_ENABLED_MASK = 1 << 6
+
     def __init__(
         self,
         resource_manager: ResourceManager,
@@ -55,6 +71,8 @@ class Tenma_Generic(PowerSupply):
             *args,
             **kwargs,
         )
+        # Earliest time the PSU is ready for the next transaction
+        self.next_transaction_time = 0
 
     def reset(self):
         """
@@ -72,36 +90,71 @@ class Tenma_Generic(PowerSupply):
         """
         pass
 
-    def _write(self, command, acquireLock=True):
-        super()._write(command, acquireLock)
-        sleep(0.1)  # Super important - do not delete
-
-    def _read(self, num_bytes=0):
+    def _wait_until_ready(self):
+        """
+        Blocks until TRANSACTION_INTERVAL has passed since the previous
+        transaction. Waiting before (rather than after) each transaction
+        means any time spent between calls counts towards the interval
+        """
+        delay = self.next_transaction_time - monotonic()
+        if delay > 0:
+            sleep(delay)
+
+    def _write(self, command):
+        # Wait out the interval before taking the lock so other threads
+        # aren't held up behind it. _raw_write checks again in case another
+        # thread got in first
+        self._wait_until_ready()
+        super()._write(command)
+
+    def _raw_write(self, command):
+        self._wait_until_ready()  # Super important - do not delete
+        super()._raw_write(command)
+        self.next_transaction_time = monotonic() + self.TRANSACTION_INTERVAL
+
+    def _raw_read(self, num_bytes=0):
         """
         Reads data from PSU as it's infernal with no termination
 
         Args:
-            None
+            num_bytes (int): Number of bytes to read. If 0, reads
+                until the PSU stops sending
 
         Returns:
-            str: Device ID String
+            str: Response from Instrument
 
         Raises:
             None
         """
+        return self._raw_read_bytes(num_bytes).decode("utf-8")
+
+    def _raw_read_bytes(self, num_bytes=0):
+        """
+        As _raw_read() but returns the response undecoded. Numeric responses
+        can be passed straight to float() and the status byte indexed
+        directly, without building a str first
+        """
+        self._wait_until_ready()  # Super important - do not delete
         if num_bytes:
-            return_string = self.dev.read_bytes(num_bytes).decode("utf-8")
+            response = self.dev.read_bytes(num_bytes)
         else:
-            return_string = ""
-            while True:
-                try:
-                    return_string += self.dev.read_bytes(1).decode("utf-8")
-                except VisaIOError:
-                    break
-        assert return_string
-
-        sleep(0.1)  # Super important - do not delete
-        return return_string
+            # No terminator so the end of the response is detected by the
+            # PSU going quiet. Once the first byte has arrived the rest
+            # follow back-to-back, so only wait INTER_BYTE_TIMEOUT for them.
+            # Whatever has already arrived is read in one call
+            response = bytearray(self.dev.read_bytes(1))
+            with self.device_timeout(self.INTER_BYTE_TIMEOUT):
+                while True:
+                    try:
+                        response += self.dev.read_bytes(
+                            self.dev.bytes_in_buffer or 1
+                        )
+                    except VisaIOError:
+                        break
+            response = bytes(response)
+        self.next_transaction_time = monotonic() + self.TRANSACTION_INTERVAL
+        assert response
+        return response
 
     def _query(self, command, num_bytes=None):
         """
@@ -118,12 +171,39 @@ class Tenma_Generic(PowerSupply):
         Raises:
             None
         """
-        try:
-            self.lock.acquire()
-            self._write(command, acquireLock=False)
-            return self._read(num_bytes)
-        finally:
-            self.lock.release()
+        return self._query_bytes(command, num_bytes).decode("utf-8")
+
+    def _query_bytes(self, command, num_bytes=None):
+        """
+        As _query() but returns the response undecoded
+        """
+        self._wait_until_ready()
+        with self.lock:
+            self._raw_write(command)
+            return self._raw_read_bytes(num_bytes)
+
+    def _query_many(self, queries):
+        """
+        Sends each command in turn and returns the undecoded responses,
+        holding the lock once for the lot rather than once per query
+
+        Args:
+            queries (List[Tuple[str, int]]): Commands to send and the
+                number of bytes to read for each
+
+        Returns:
+            List[bytes]: Responses from Instrument
+
+        Raises:
+            None
+        """
+        self._wait_until_ready()
+        with self.lock:
+            responses = []
+            for command, num_bytes in queries:
+                self._raw_write(command)
+                responses.append(self._raw_read_bytes(num_bytes))
+            return responses
 
     def set_channel_voltage(self, channel_number, voltage):
         """
@@ -140,7 +220,7 @@ class Tenma_Generic(PowerSupply):
         Raises:
             None
         """
-        self._write(f"VSET{channel_number}:{round(voltage, 2)}")
+        self._write(self.VOLTAGE_SET_COMMAND % (channel_number, voltage))
 
     def get_channel_voltage(self, channel_number):
         """
@@ -156,7 +236,7 @@ class Tenma_Generic(PowerSupply):
         Raises:
             None
         """
-        return float(self._query(f"VSET{channel_number}?", 5))
+        return float(self._query_bytes(f"VSET{channel_number}?", 5))
 
     def measure_channel_voltage(self, channel_number):
         """
@@ -172,7 +252,7 @@ class Tenma_Generic(PowerSupply):
         Raises:
             None
         """
-        return float(self._query(f"VOUT{channel_number}?", 5))
+        return float(self._query_bytes(f"VOUT{channel_number}?", 5))
 
     def set_channel_current_limit(self, channel_number, current):
         """
@@ -189,7 +269,7 @@ class Tenma_Generic(PowerSupply):
         Raises:
             None
         """
-        self._write(f"ISET{channel_number}:{round(current, 3)}")
+        self._write(self.CURRENT_SET_COMMAND % (channel_number, current))
 
     def get_channel_current_limit(self, channel_number):
         """
@@ -205,7 +285,7 @@ class Tenma_Generic(PowerSupply):
         Raises:
             None
         """
-        return float(self._query(f"ISET{channel_number}?", 6))
+        return float(self._query_bytes(f"ISET{channel_number}?", 6))
 
     def measure_channel_current(self, channel_number):
         """
@@ -221,7 +301,33 @@ class Tenma_Generic(PowerSupply):
         Raises:
             None
         """
-        return float(self._query(f"IOUT{channel_number}?", 5))
+        return float(self._query_bytes(f"IOUT{channel_number}?", 5))
+
+    def get_channel_telemetry(self, channel_number):
+        """
+        Reads setpoints and outputs on channel <channel_number> in one go,
+        without other threads getting access to the PSU in between
+
+        Args:
+            channel_number (int): Power Supply Channel Number
+                to read
+
+        Returns:
+            Tuple[float, float, float, float]: Voltage setpoint, output
+                voltage, current setpoint and output current
+
+        Raises:
+            None
+        """
+        responses = self._query_many(
+            (
+                (f"VSET{channel_number}?", 5),
+                (f"VOUT{channel_number}?", 5),
+                (f"ISET{channel_number}?", 6),
+                (f"IOUT{channel_number}?", 5),
+            )
+        )
+        return tuple(float(x) for x in responses)
 
     def set_channel_output_enabled_state(self, channel_number: int, enabled: bool):
         self._write(f"OUT{1 if enabled else 0}")
@@ -229,15 +335,10 @@ class Tenma_Generic(PowerSupply):
             sleep(1)
 
     def get_channel_output_enabled_state(self, channel_number: int) -> bool:
-        status = self._get_status_byte()
-        return status[6] == "1"
+        return bool(self._cached_status_byte() & self.OUTPUT_ENABLED_MASK)
 
     def _get_status_byte(self) -> int:
-        # Get status byte and convert to string in reverse
-        # order so status[0] = bit 0
-        status = ord(self._query("STATUS?", 1))
-        status = format(status, "08b")[::-1]
-        return status
+        return self._query_bytes("STATUS?", 1)[0]
 
     def get_channel_errors(self, channel_number):
         return []
@@ -258,10 +359,10 @@ class Tenma_Generic(PowerSupply):
         Raises:
             None
         """
-        status = self._get_status_byte()
+        status = self._cached_status_byte()
 
         # Only have one channel on this device
-        if status[0] == "0":
+        if not status & self.CHANNEL1_CV_MODE_MASK:
             logging.error(
                 f"PSU: {self.name}, "
                 f"Channel {self.channels[channel_number - 1].name} "
@@ -15,6 +15,8 @@ class Agilent_E4433B(SignalGenerator):
     Class for Agilent E4433B
     """
 
+    SUPPORTS_COMPOUND_COMMANDS = True
+
     def __init__(
         self,
         resource_manager: ResourceManager,
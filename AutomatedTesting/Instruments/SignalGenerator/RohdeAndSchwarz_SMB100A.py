@@ -15,6 +15,8 @@ class RohdeAndSchwarz_SMB100A(SignalGenerator):
     Class for Rohde & Schwarz SMB100A
     """
 
+    SUPPORTS_COMPOUND_COMMANDS = True
+
     def __init__(
         self,
         resource_manager: ResourceManager,
@@ -18,6 +18,17 @@ class SignalGeneratorModulation(Enum):
 
 
 class SignalGeneratorChannel(InstrumentChannel):
+    __slots__ = (
+        "absolute_max_power",
+        "absolute_min_power",
+        "max_power",
+        "min_power",
+        "absolute_max_freq",
+        "absolute_min_freq",
+        "max_freq",
+        "min_freq",
+    )
+
     def __init__(
         self,
         channel_number: int,
@@ -68,6 +68,48 @@ class Siglent_SSA3032XPlus(SpectrumAnalyser):
             300e3,
             1e6,
         ]
+        # True if trace data is sent as binary, None if unknown
+        self.trace_data_binary = None
+        # Byte order of binary trace data
+        self.trace_data_big_endian = True
+
+    def initialise(self):
+        super().initialise()
+        if self.only_software_control:
+            # A reset leaves trace data in ASCII
+            self.trace_data_binary = False
+            self.set_trace_data_format(self.prefer_binary)
+        else:
+            # Leave the format as set from the front panel, just find out
+            # what it is so trace data can be decoded
+            self.trace_data_binary = self.get_trace_data_format()
+            if self.trace_data_binary:
+                self.trace_data_big_endian = (
+                    self._query(":FORM:BORD?").upper().startswith("NORM")
+                )
+        return self
+
+    def set_trace_data_format(self, binary: bool):
+        """
+        Selects binary (big-endian 32-bit float) or ASCII trace data.
+        Nothing is sent if that format is already selected
+        """
+        if self.trace_data_binary == binary:
+            return
+        if binary:
+            self._write(":FORM:TRAC:DATA REAL")
+            # Set the byte order rather than relying on the default
+            self._write(":FORM:BORD NORM")
+        else:
+            self._write(":FORM:TRAC:DATA ASC")
+        self.trace_data_binary = binary
+        self.trace_data_big_endian = True
+
+    def get_trace_data_format(self) -> bool:
+        """
+        Returns True if trace data is sent as binary, False if ASCII
+        """
+        return self._query(":FORM:TRAC:DATA?").upper().startswith("REAL")
 
     def get_instrument_errors(self) -> List[Tuple[int, str]]:
         return []
@@ -193,8 +235,13 @@ class Siglent_SSA3032XPlus(SpectrumAnalyser):
         return float(self._query(":DISP:WIND:TRAC:Y:RLEV?"))
 
     def get_trace_data(self) -> List[float]:
-        data = self._query(":TRAC:DATA?")
-        powers = [float(x) for x in data.split(",")]
+        if self.trace_data_binary:
+            powers = self._query_binary(
+                ":TRAC:DATA?", is_big_endian=self.trace_data_big_endian
+            )
+        else:
+            data = self._query(":TRAC:DATA?")
+            powers = [float(x) for x in data.split(",")]
         freqs = linspace(
             self.get_start_freq(), self.get_stop_freq(), self.get_sweep_points()
         )
@@ -1,8 +1,32 @@
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from itertools import groupby
+from typing import List, Optional, Tuple
 
 import git
 import xlsxwriter
+from xlsxwriter.utility import xl_col_to_name
+
+# Column letters for every column Excel supports (A -> XFD)
+_COL_LETTERS = tuple(xl_col_to_name(i) for i in range(16384))
+
+
+def column_letter(column: int) -> str:
+    """
+    Returns the Excel column letters for 0-indexed column e.g. 0 -> "A",
+    26 -> "AA"
+    """
+    return _COL_LETTERS[column]
+
+
+@lru_cache(maxsize=1)
+def _repo_info() -> Tuple[str, bool]:
+    """
+    Returns (commit hash, is dirty) for the test code repo. Cached as
+    this is the same for every worksheet in a run and is_dirty() is slow
+    """
+    repo = git.Repo(search_parent_directories=True)
+    return repo.head.object.hexsha, repo.is_dirty()
 
 
 class ExcelWorksheetWrapper(xlsxwriter.workbook.Worksheet):
@@ -12,6 +36,7 @@ class ExcelWorksheetWrapper(xlsxwriter.workbook.Worksheet):
     max_row: int
     hidden_columns: List[int]
     headers_row: int
+    _buffer: List[list]
 
     AVAILABLE_COLOURS = [
         "blue",
@@ -39,9 +64,17 @@ class ExcelWorksheetWrapper(xlsxwriter.workbook.Worksheet):
         self.hidden_columns = []
         self.hidden_rows = []
         self.name = name
+        self._sheet_reference = f"='{name}'!$"
         self.headers_row = 0
         self.headers_column = 0
         self.chart = None
+        self._buffer = []
+        # Bypass the type dispatch in write() for numbers. Strings still go
+        # through write() so formulas ("=...") and URLs are recognised
+        self._typed_writers = {
+            int: self.write_number,
+            float: self.write_number,
+        }
 
         now = datetime.now()
 
@@ -50,10 +83,10 @@ class ExcelWorksheetWrapper(xlsxwriter.workbook.Worksheet):
         self.write(1, 0, "Time")
         self.write(1, 1, now.strftime("%H:%M"))
         self.write(2, 0, "Test code version")
-        repo = git.Repo(search_parent_directories=True)
-        self.write(2, 1, repo.head.object.hexsha)
+        hexsha, dirty = _repo_info()
+        self.write(2, 1, hexsha)
         self.write(3, 0, "Repo status")
-        self.write(3, 1, "Dirty" if repo.is_dirty() else "Clean")
+        self.write(3, 1, "Dirty" if dirty else "Clean")
         self.write(4, 0, "DUT Name")
         self.write(5, 0, dut_name)
         self.write(5, 0, "Notes")
@@ -64,15 +97,19 @@ class ExcelWorksheetWrapper(xlsxwriter.workbook.Worksheet):
         self.current_column = 0
 
     def hide_current_column(self) -> None:
-        column_letter = chr(self.current_column + ord("A"))
-        self.set_column(
-            f"{column_letter}:{column_letter}", None, None, {"hidden": True}
-        )
+        """
+        Marks the current column as hidden. Adjacent hidden columns are
+        merged into a single range when flush() is called
+        """
         self.hidden_columns.append(self.current_column)
 
     def hide_current_row(self) -> None:
+        """
+        Must be called before flush() as rows are finalised in order
+        when the workbook is in constant_memory mode
+        """
         self.set_row(self.current_row, None, None, {"hidden": True})
-        self.hidden_rows.append(self.current_column)
+        self.hidden_rows.append(self.current_row)
 
     def new_row(self):
         self.current_column = self.headers_column
@@ -84,15 +121,63 @@ class ExcelWorksheetWrapper(xlsxwriter.workbook.Worksheet):
         self.max_column = max(self.max_column, self.current_column)
         self.current_column += 1
 
+    def _buffer_cell(self, row: int, column: int, x) -> None:
+        """
+        Stores x in the cell buffer, growing the buffer as required.
+        Nothing is written to the worksheet until flush() is called
+        """
+        while len(self._buffer) <= row:
+            self._buffer.append([])
+        buffered_row = self._buffer[row]
+        if len(buffered_row) <= column:
+            buffered_row.extend([None] * (column + 1 - len(buffered_row)))
+        buffered_row[column] = x
+
     def write_and_move_right(self, x):
-        self.write(self.current_row, self.current_column, x)
-        self.max_column = max(self.max_column, self.current_column)
-        self.current_column += 1
+        column = self.current_column
+        self._buffer_cell(self.current_row, column, x)
+        if column > self.max_column:
+            self.max_column = column
+        self.current_column = column + 1
 
     def write_and_move_down(self, x):
-        self.write(self.current_row, self.current_column, x)
-        self.max_row = max(self.max_row, self.current_row)
-        self.current_row += 1
+        row = self.current_row
+        self._buffer_cell(row, self.current_column, x)
+        if row > self.max_row:
+            self.max_row = row
+        self.current_row = row + 1
+
+    def flush(self) -> None:
+        """
+        Writes all buffered cells to the worksheet in one pass.
+        Must be called before the workbook is closed
+
+        Cells are written in row-major order so this is safe to use with
+        workbooks opened with {"constant_memory": True}, provided any
+        direct writes above the buffered data (e.g. the header block
+        written by initialise()) have already been made
+        """
+        write = self.write
+        typed_writers = self._typed_writers
+        for row, buffered_row in enumerate(self._buffer):
+            for column, x in enumerate(buffered_row):
+                # Empty cells would be ignored by write() anyway
+                if x is None or x == "":
+                    continue
+                typed_writers.get(type(x), write)(row, column, x)
+        self._buffer = []
+
+        # Consecutive columns share the same (index - position) value
+        hidden_columns = sorted(set(self.hidden_columns))
+        for _, run in groupby(
+            enumerate(hidden_columns), lambda pair: pair[1] - pair[0]
+        ):
+            run = list(run)
+            first_column = _COL_LETTERS[run[0][1]]
+            last_column = _COL_LETTERS[run[-1][1]]
+            self.set_column(
+                f"{first_column}:{last_column}", None, None, {"hidden": True}
+            )
 
     def save_headers_row(self):
         self.headers_row = self.current_row
@@ -104,16 +189,17 @@ class ExcelWorksheetWrapper(xlsxwriter.workbook.Worksheet):
         """
 
         # Plot upper tone
-        column = chr(self.current_column + ord("A"))
-        headers_column = chr(self.headers_column + ord("A"))
+        column = _COL_LETTERS[self.current_column]
+        headers_column = _COL_LETTERS[self.headers_column]
+        sheet_reference = self._sheet_reference
         # +1 for data being one row lower, +1 for stupid 0/1 indexing
         start_row = self.headers_row + 2
+        end_row = self.max_row + 1
         commands = {
-            "name": f"='{self.name}'!${column}${self.headers_row + 1}",
-            "categories": f"='{self.name}'!${headers_column}${start_row}:"  # noqa E501
-            f"${headers_column}{self.max_row + 1}",
-            "values": f"='{self.name}'!${column}${start_row}:"
-            f"${column}{self.max_row + 1}",
+            "name": f"{sheet_reference}{column}${self.headers_row + 1}",
+            "categories": f"{sheet_reference}{headers_column}${start_row}:"
+            f"${headers_column}{end_row}",
+            "values": f"{sheet_reference}{column}${start_row}:${column}{end_row}",
         }
         if extra_commands:
             commands.update(extra_commands)
@@ -1,5 +1,6 @@
 from copy import copy
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 import numpy
@@ -40,6 +41,8 @@ def prefixify(x: float, units: str = "", decimal_places: Optional[int] = None) -
             return f"{x}{prefix}{units}"
 
 
+# Sweeps keep asking for the same few frequencies
+@lru_cache(maxsize=1024)
 def readable_freq(freq: float) -> str:
     return prefixify(freq, units="Hz", decimal_places=9)
 
@@ -106,7 +106,7 @@ def run_gain_flatness_test(
     if excel_workbook:
         workbook = excel_workbook
     else:
-        workbook = xlsxwriter.Workbook("pae.xlsx")
+        workbook = xlsxwriter.Workbook("pae.xlsx", {"constant_memory": True})
 
     worksheet_name = "Overall IMD results"
     worksheet = workbook.add_worksheet(worksheet_name)
@@ -203,6 +203,7 @@ def run_gain_flatness_test(
             ],
         }
     )
+    worksheet.flush()
 
     if not excel_workbook:
         workbook.close()
@@ -16,7 +16,7 @@ from AutomatedTesting.Instruments.SignalGenerator.SignalGenerator import (
 from AutomatedTesting.Instruments.SpectrumAnalyser.SpectrumAnalyser import (
     SpectrumAnalyser,
 )
-from AutomatedTesting.Misc.ExcelHandler import ExcelWorksheetWrapper
+from AutomatedTesting.Misc.ExcelHandler import ExcelWorksheetWrapper, column_letter
 from AutomatedTesting.Misc.UsefulFunctions import (
     StraightLine,
     best_fit_line_with_known_gradient,
@@ -173,7 +173,7 @@ def run_imd_test(
     if excelWorkbook:
         workbook = excelWorkbook
     else:
-        workbook = xlsxwriter.Workbook("imdTest.xlsx")
+        workbook = xlsxwriter.Workbook("imdTest.xlsx", {"constant_memory": True})
 
     overallResultsWorksheetName = "Overall IMD results"
     overallWorksheet = workbook.add_worksheet(overallResultsWorksheetName)
@@ -301,8 +301,8 @@ def run_imd_test(
                         measuredIPn.best_fit, tone_best_fit
                     )
 
-                column = chr(worksheet.current_column - 1 + ord("A"))
-                headers_column = chr(worksheet.headers_column + ord("A"))
+                column = column_letter(worksheet.current_column - 1)
+                headers_column = column_letter(worksheet.headers_column)
                 startRow = worksheet.headers_row + 2
                 chart.add_series(
                     {
@@ -406,6 +406,7 @@ def run_imd_test(
                 "minor_gridlines": {"visible": True},
             }
         )
+        worksheet.flush()
 
     # # We now have all the data plotted so add a final sheet
     # # with the overall results
@@ -444,8 +445,8 @@ def run_imd_test(
             except KeyError:
                 worksheet.write_and_move_down("")
         if gotResults:
-            column = chr(worksheet.current_column + ord("A"))
-            headers_column = chr(worksheet.headers_column + ord("A"))
+            column = column_letter(worksheet.current_column)
+            headers_column = column_letter(worksheet.headers_column)
             startRow = worksheet.headers_row + 2
             chart.add_series(
                 {
@@ -469,8 +470,8 @@ def run_imd_test(
             except KeyError:
                 worksheet.write_and_move_down("")
 
-        column = chr(worksheet.current_column + ord("A"))
-        headers_column = chr(worksheet.headers_column + ord("A"))
+        column = column_letter(worksheet.current_column)
+        headers_column = column_letter(worksheet.headers_column)
         startRow = worksheet.headers_row + 2
         chart.add_series(
             {
@@ -483,6 +484,7 @@ def run_imd_test(
             }
         )
         worksheet.new_column()
+    worksheet.flush()
 
     if not excelWorkbook:
         workbook.close()
@@ -44,7 +44,9 @@ else:
 now = datetime.now().strftime("%Y%m%d-%H%M%S")
 resultsDirectory = "/mnt/Transit"
 
-with Workbook(f"{resultsDirectory}/results_{now}.xlsx") as workbook:
+with Workbook(
+    f"{resultsDirectory}/results_{now}.xlsx", {"constant_memory": True}
+) as workbook:
     worksheet = workbook.add_worksheet("Results")
     worksheet.__class__ = ExcelWorksheetWrapper
     worksheet.initialise("Results")
@@ -55,3 +57,4 @@ with Workbook(f"{resultsDirectory}/results_{now}.xlsx") as workbook:
         for x in powers:
             worksheet.write_and_move_down(round(x, 2))
         worksheet.new_column()
+    worksheet.flush()
@@ -0,0 +1,313 @@
+import logging
+from threading import Event, RLock, current_thread
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from AutomatedTesting.Instruments.BaseInstrument import (
+    BaseInstrument,
+    ErrorMonitor,
+    InstrumentConnectionError,
+    is_query_only,
+    submit_instrument_io,
+)
+
+
+@pytest.fixture
+def instrument() -> BaseInstrument:
+    instrument = BaseInstrument(
+        resource_manager=MagicMock(),
+        visa_address="TCPIP0::127.0.0.1::INSTR",
+        name="Test Instrument",
+        expected_idn_response="",
+        verify=True,
+        logger=logging.getLogger(__name__),
+    )
+    instrument.dev = MagicMock()
+    return instrument
+
+
+def sent_messages(instrument: BaseInstrument) -> list:
+    return [call.args[0] for call in instrument.dev.write.call_args_list]
+
+def test_get_instrument_errors(instrument: BaseInstrument):
+    instrument.dev.query.return_value = (
+        '-113,"Undefined header";+0,"No error",-222,"Data out of range"\n'
+    )
+    assert instrument.get_instrument_errors() == [
+        (-113, "Undefined header"),
+        (-222, "Data out of range"),
+    ]
+    instrument.dev.query.assert_called_once_with("SYST:ERR?")
+
+
+@pytest.mark.parametrize("response", ['0,"No error"', '+0,"No error"'])
+def test_get_instrument_errors_empty(instrument: BaseInstrument, response):
+    instrument.dev.query.return_value = response + "\n"
+    assert instrument.get_instrument_errors() == []
+
+
+@pytest.fixture
+def connection_error():
+    InstrumentConnectionError._last_resource_scan = None
+    resource_manager = MagicMock()
+    resource_manager.list_resources.return_value = ("GPIB0::14::INSTR",)
+    yield InstrumentConnectionError("Test Instrument", "", resource_manager)
+    InstrumentConnectionError._last_resource_scan = None
+
+
+def test_resource_scan_reused(connection_error: InstrumentConnectionError):
+    resource_manager = connection_error.resource_manager
+    lifetime = InstrumentConnectionError.RESOURCE_SCAN_LIFETIME
+    with patch(
+        "AutomatedTesting.Instruments.BaseInstrument.monotonic"
+    ) as monotonic:
+        monotonic.return_value = 100
+        assert connection_error.available_resources == ("GPIB0::14::INSTR",)
+        # Later errors with the same resource manager reuse the scan
+        monotonic.return_value = 100 + lifetime
+        other_error = InstrumentConnectionError("Other", "", resource_manager)
+        assert other_error.available_resources == ("GPIB0::14::INSTR",)
+        assert resource_manager.list_resources.call_count == 1
+
+        # Until it expires
+        monotonic.return_value = 100 + lifetime + 1
+        assert other_error.available_resources == ("GPIB0::14::INSTR",)
+        assert resource_manager.list_resources.call_count == 2
+
+
+def test_resource_scan_per_resource_manager(
+    connection_error: InstrumentConnectionError,
+):
+    connection_error.available_resources
+    other_resource_manager = MagicMock()
+    other_resource_manager.list_resources.return_value = ()
+    other_error = InstrumentConnectionError("Other", "", other_resource_manager)
+    assert other_error.available_resources == ()
+    other_resource_manager.list_resources.assert_called_once()
+
+
+def test_write_batch_without_compound_commands(instrument: BaseInstrument):
+    instrument._write_batch(["FREQ 1", "*CLS", ":POW 0"])
+    assert sent_messages(instrument) == ["FREQ 1", "*CLS", ":POW 0"]
+
+
+def test_write_batch_prefixes_root(instrument: BaseInstrument):
+    instrument.SUPPORTS_COMPOUND_COMMANDS = True
+    instrument._write_batch(["FREQ 1", "*CLS", ":POW 0"])
+    assert sent_messages(instrument) == [":FREQ 1;*CLS;:POW 0"]
+
+
+def test_write_batch_splits_long_messages(instrument: BaseInstrument):
+    instrument.SUPPORTS_COMPOUND_COMMANDS = True
+    instrument.MAX_MESSAGE_LENGTH = 20
+    # Each command is 9 characters once prefixed, so two fit in a message
+    instrument._write_batch([f"FREQ {i}00" for i in range(5)])
+    messages = sent_messages(instrument)
+    assert messages == [
+        ":FREQ 000;:FREQ 100",
+        ":FREQ 200;:FREQ 300",
+        ":FREQ 400",
+    ]
+    assert all(len(x) <= instrument.MAX_MESSAGE_LENGTH for x in messages)
+
+
+def test_submit_instrument_io_runs_on_pool():
+    future = submit_instrument_io(lambda: current_thread().name)
+    assert future.result(timeout=5).startswith("instrument_io")
+
+
+def test_submit_instrument_io_nested_runs_inline():
+    def outer():
+        outer_thread = current_thread()
+        inner = submit_instrument_io(current_thread)
+        # Already complete as it ran in this thread rather than the pool
+        assert inner.done()
+        return outer_thread, inner.result()
+
+    outer_thread, inner_thread = submit_instrument_io(outer).result(timeout=5)
+    assert inner_thread is outer_thread
+
+
+def test_submit_instrument_io_nested_exception():
+    def outer():
+        return submit_instrument_io(int, "not a number").exception()
+
+    assert isinstance(submit_instrument_io(outer).result(timeout=5), ValueError)
+
+
+def test_batch_ignores_earlier_errors(instrument: BaseInstrument):
+    instrument.SUPPORTS_COMPOUND_COMMANDS = True
+    # Error bit left over from before the batch, then a clean batch
+    instrument.dev.query.side_effect = ["32", "0"]
+    with instrument.batch():
+        assert not instrument.verify
+        instrument._write("FREQ 1")
+        instrument._write("POW 0")
+        instrument.dev.write.assert_not_called()
+    assert sent_messages(instrument) == [":FREQ 1;:POW 0"]
+    assert [x.args[0] for x in instrument.dev.query.call_args_list] == [
+        "*ESR?",
+        "*ESR?",
+    ]
+    assert instrument.verify
+
+
+def test_batch_error(instrument: BaseInstrument):
+    instrument.SUPPORTS_COMPOUND_COMMANDS = True
+    # Execution error caused by the batch's own commands
+    instrument.dev.query.side_effect = ["0", "16"]
+    with pytest.raises(AssertionError):
+        with instrument.batch():
+            instrument._write("FREQ 100GHz")
+    assert sent_messages(instrument) == [":FREQ 100GHz"]
+
+
+def test_batch_without_verify(instrument: BaseInstrument):
+    instrument.SUPPORTS_COMPOUND_COMMANDS = True
+    instrument.verify = False
+    with instrument.batch():
+        instrument._write("FREQ 1")
+    instrument.dev.query.assert_not_called()
+    assert sent_messages(instrument) == [":FREQ 1"]
+
+
+@pytest.mark.parametrize(
+    "command, query_only",
+    [
+        ("FREQ?", True),
+        ("MEAS? DEF, 3, (@1)", True),
+        (":CHAN1:COUP?;:CHAN1:DISP?", True),
+        ("FREQ 1GHz;:FREQ?;:MEAS? DEF, 3, (@1)", False),
+        ("*RST;*CLS;*OPC?", False),
+        ("CONF:VOLT:DC 10", False),
+    ],
+)
+def test_is_query_only(command: str, query_only: bool):
+    assert is_query_only(command) == query_only
+
+
+def test_cached_query(instrument: BaseInstrument):
+    instrument.dev.query.side_effect = ["DC", "1", "0.5", "AC"]
+    assert instrument._cached_query(":CHAN1:COUP?") == "DC"
+    # Other queries don't change settings so leave the cache alone
+    assert instrument._cached_query(":CHAN1:DISP?") == "1"
+    assert instrument._query(":MEAS:VRMS?") == "0.5"
+    assert instrument._cached_query(":CHAN1:COUP?") == "DC"
+    assert instrument.dev.query.call_count == 3
+
+    instrument._write(":CHAN1:COUP AC")
+    assert instrument._cached_query(":CHAN1:COUP?") == "AC"
+    assert instrument.dev.query.call_count == 4
+
+
+def test_cached_query_cleared_by_compound_query(instrument: BaseInstrument):
+    instrument.dev.query.side_effect = ["DC", "AC", "AC"]
+    assert instrument._cached_query(":CHAN1:COUP?") == "DC"
+    assert instrument._query(":CHAN1:COUP AC;:CHAN1:COUP?") == "AC"
+    assert instrument._cached_query(":CHAN1:COUP?") == "AC"
+    assert instrument.dev.query.call_count == 3
+
+
+def test_cached_query_interactive_control(instrument: BaseInstrument):
+    # Settings can be changed from the front panel so nothing is cached
+    instrument.only_software_control = False
+    instrument.dev.query.side_effect = ["DC", "AC"]
+    assert instrument._cached_query(":CHAN1:COUP?") == "DC"
+    assert instrument._cached_query(":CHAN1:COUP?") == "AC"
+
+
+class MonitoredInstrument:
+    def __init__(self, name: str, fail: bool = False):
+        self.name = name
+        self.lock = RLock()
+        self.logger = logging.getLogger(__name__)
+        self.fail = fail
+        self.checked = Event()
+        self.lock_held = []
+
+    def check_instrument_errors(self):
+        self.lock_held.append(self.lock._is_owned())
+        self.checked.set()
+        if self.fail:
+            raise RuntimeError("Instrument disconnected")
+
+
+@pytest.fixture
+def monitor() -> ErrorMonitor:
+    monitor = ErrorMonitor()
+    monitor.POLL_INTERVAL = 0.01
+    return monitor
+
+
+def test_error_monitor(monitor: ErrorMonitor):
+    failing = MonitoredInstrument("Failing", fail=True)
+    instrument = MonitoredInstrument("Working")
+    monitor.register(failing)
+    monitor.register(instrument)
+    thread = monitor.thread
+    # One failing instrument doesn't stop the rest being checked
+    assert instrument.checked.wait(5)
+    assert failing.checked.wait(5)
+    assert all(instrument.lock_held)
+
+    monitor.unregister(failing)
+    assert thread.is_alive()
+    monitor.unregister(instrument)
+    # Stopped once the last instrument is unregistered
+    assert not thread.is_alive()
+    assert monitor.thread is None
+
+
+def test_error_monitor_skips_busy_instrument(monitor: ErrorMonitor):
+    instrument = MonitoredInstrument("Busy")
+    with instrument.lock:
+        monitor.register(instrument)
+        assert not instrument.checked.wait(0.1)
+    assert instrument.checked.wait(5)
+    monitor.unregister(instrument)
+
+
+def test_error_monitor_report_errors(monitor: ErrorMonitor):
+    with patch(
+        "AutomatedTesting.Instruments.BaseInstrument.signal.pthread_kill"
+    ) as pthread_kill:
+        monitor.report_errors("PSU", [(-222, "Data out of range")])
+        monitor.report_errors("Scope", [(-113, "Undefined header")])
+    assert monitor.error_flag.is_set()
+    # Main thread is only interrupted for the first error
+    pthread_kill.assert_called_once()
+    assert monitor.errors.get_nowait() == ("PSU", -222, "Data out of range")
+    assert monitor.errors.get_nowait() == ("Scope", -113, "Undefined header")
+
+
+def test_deferred_verification(instrument: BaseInstrument):
+    getter = MagicMock(__name__="get_voltage", return_value=3)
+    with instrument.deferred_verification():
+        for voltage in (1, 2, 3):
+            assert not instrument.verify_setting(getter, voltage)
+        getter.assert_not_called()
+    # Only the final value of the setting is read back
+    getter.assert_called_once()
+
+    # Outside the block settings are checked straight away
+    assert instrument.verify_setting(getter, 3)
+    assert getter.call_count == 2
+
+
+def test_deferred_verification_failure(instrument: BaseInstrument):
+    getter = MagicMock(__name__="get_voltage", return_value=1)
+    with pytest.raises(AssertionError):
+        with instrument.deferred_verification():
+            instrument.verify_setting(getter, 2)
+    # Nothing is left pending for the next block
+    assert instrument.pending_verifications == {}
+
+
+def test_deferred_verification_other_thread(instrument: BaseInstrument):
+    getter = MagicMock(__name__="get_voltage", return_value=1)
+    with instrument.deferred_verification():
+        # Settings made by other threads are still checked straight away
+        future = submit_instrument_io(instrument.verify_setting, getter, 1)
+        assert future.result(timeout=5)
+        getter.assert_called_once()
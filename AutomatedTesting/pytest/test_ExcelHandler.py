@@ -0,0 +1,123 @@
+import io
+
+import pytest
+import xlsxwriter
+
+from AutomatedTesting.Misc.ExcelHandler import ExcelWorksheetWrapper, column_letter
+
+
+@pytest.fixture
+def worksheet() -> ExcelWorksheetWrapper:
+    workbook = xlsxwriter.Workbook(
+        io.BytesIO(), {"in_memory": True, "constant_memory": True}
+    )
+    worksheet = workbook.add_worksheet(worksheet_class=ExcelWorksheetWrapper)
+    worksheet.initialise(name="Test")
+    yield worksheet
+    workbook.close()
+
+
+@pytest.fixture
+def writes(worksheet: ExcelWorksheetWrapper, monkeypatch) -> list:
+    """
+    Records every (writer, row, column, value) passed to the worksheet
+    """
+    writes = []
+    for writer in ("write_number", "write_string", "write"):
+        original = getattr(worksheet, writer)
+
+        def record(row, column, x, *args, writer=writer, original=original):
+            writes.append((writer, row, column, x))
+            return original(row, column, x, *args)
+
+        monkeypatch.setattr(worksheet, writer, record)
+    # initialise() bound the unpatched writers, so rebind them
+    worksheet._typed_writers = {
+        cell_type: getattr(worksheet, writer.__name__)
+        for cell_type, writer in worksheet._typed_writers.items()
+    }
+    return writes
+
+
+def test_flush_row_major(worksheet: ExcelWorksheetWrapper, writes: list):
+    worksheet.write_and_move_down("X")
+    worksheet.write_and_move_down(1)
+    worksheet.write_and_move_down(2)
+    worksheet.new_column()
+    worksheet.write_and_move_down("Y")
+    worksheet.write_and_move_down(3.5)
+    worksheet.write_and_move_down(4.5)
+    assert writes == []
+
+    worksheet.flush()
+    start = worksheet.headers_row
+    assert [x[1:] for x in writes] == [
+        (start, 0, "X"),
+        (start, 1, "Y"),
+        (start + 1, 0, 1),
+        (start + 1, 1, 3.5),
+        (start + 2, 0, 2),
+        (start + 2, 1, 4.5),
+    ]
+    # Rows must be written in order as the workbook is in constant_memory mode
+    assert [x[1] for x in writes] == sorted(x[1] for x in writes)
+    assert worksheet.max_row == start + 2
+
+
+def test_flush_clears_buffer(worksheet: ExcelWorksheetWrapper, writes: list):
+    worksheet.write_and_move_down(1)
+    worksheet.flush()
+    worksheet.flush()
+    assert len(writes) == 1
+
+
+def test_column_letter():
+    assert column_letter(0) == "A"
+    assert column_letter(25) == "Z"
+    assert column_letter(26) == "AA"
+    assert column_letter(16383) == "XFD"
+
+
+def test_flush_typed_writers(worksheet: ExcelWorksheetWrapper, writes: list):
+    for x in ("Name", 1, 2.5, None, "", True):
+        worksheet.write_and_move_down(x)
+    worksheet.flush()
+    # Empty cells are skipped, anything that isn't a number uses write()
+    assert [(x[0], x[3]) for x in writes] == [
+        ("write", "Name"),
+        ("write_number", 1),
+        ("write_number", 2.5),
+        ("write", True),
+    ]
+
+
+def test_flush_formula_and_url():
+    # Without constant_memory so the cells can be inspected after flush()
+    workbook = xlsxwriter.Workbook(io.BytesIO(), {"in_memory": True})
+    worksheet = workbook.add_worksheet(worksheet_class=ExcelWorksheetWrapper)
+    worksheet.initialise(name="Test")
+    worksheet.write_and_move_down("=SUM(A1:A2)")
+    worksheet.write_and_move_down("https://example.com")
+    worksheet.flush()
+
+    start = worksheet.headers_row
+    assert type(worksheet.table[start][0]).__name__ == "Formula"
+    assert 0 in worksheet.hyperlinks[start + 1]
+    workbook.close()
+
+
+def test_flush_merges_hidden_columns(worksheet: ExcelWorksheetWrapper, monkeypatch):
+    set_column_calls = []
+    monkeypatch.setattr(
+        worksheet, "set_column", lambda *args: set_column_calls.append(args)
+    )
+    for column in (0, 1, 2, 4, 26, 27):
+        worksheet.current_column = column
+        worksheet.hide_current_column()
+    # Hiding a column twice shouldn't split or repeat a run
+    worksheet.current_column = 1
+    worksheet.hide_current_column()
+
+    worksheet.flush()
+    assert [x[0] for x in set_column_calls] == ["A:C", "E:E", "AA:AB"]
+    assert all(x[3] == {"hidden": True} for x in set_column_calls)
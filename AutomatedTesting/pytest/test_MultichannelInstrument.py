@@ -0,0 +1,66 @@
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+from AutomatedTesting.Instruments.BaseInstrument import error_monitor
+from AutomatedTesting.Instruments.MultichannelInstrument import (
+    InstrumentChannel,
+    MultichannelInstrument,
+)
+
+
+class FakeInstrument(MultichannelInstrument):
+    SUPPORTS_COMPOUND_COMMANDS = True
+
+    def set_channel_output_enabled_state(self, channel_number: int, enabled: bool):
+        self._write(f"CHAN{channel_number}:DISP {1 if enabled else 0}")
+
+    def get_channel_output_enabled_state(self, channel_number: int) -> bool:
+        return False
+
+
+@pytest.fixture
+def instrument() -> FakeInstrument:
+    logger = logging.getLogger(__name__)
+    instrument = FakeInstrument(
+        resource_manager=MagicMock(),
+        visa_address="TCPIP0::127.0.0.1::INSTR",
+        name="Test Instrument",
+        expected_idn_response="",
+        verify=True,
+        channel_count=2,
+        channels=[InstrumentChannel(i, None, logger) for i in (1, 2)],
+        logger=logger,
+    )
+    for x in instrument.channels:
+        x.instrument = instrument
+    instrument.dev = dev = MagicMock()
+    dev.query.side_effect = lambda command: {"*ESR?": "0"}.get(
+        command, '+0,"No error"'
+    )
+    error_monitor.register(instrument)
+    instrument.error_monitored = True
+    yield instrument
+    if instrument.error_monitored:
+        error_monitor.unregister(instrument)
+
+
+def test_cleanup(instrument: FakeInstrument):
+    dev = instrument.dev
+    instrument.cleanup()
+    dev.write.assert_any_call(":CHAN1:DISP 0;:CHAN2:DISP 0")
+    dev.close.assert_called_once()
+    assert instrument not in error_monitor.instruments
+
+
+def test_cleanup_closes_after_failed_verify(instrument: FakeInstrument):
+    dev = instrument.dev
+    # Execution error reported by the batch turning the channels off
+    dev.query.side_effect = lambda command: {"*ESR?": "16"}.get(
+        command, '+0,"No error"'
+    )
+    instrument.cleanup()
+    dev.close.assert_called_once()
+    assert instrument.dev is None
+    assert instrument not in error_monitor.instruments
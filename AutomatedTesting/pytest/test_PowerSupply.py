@@ -0,0 +1,76 @@
+from threading import current_thread
+
+from AutomatedTesting.Instruments.PowerSupply.PowerSupply import measure_channels
+
+
+class FakeLock:
+    def __init__(self):
+        self.owner = None
+        self.count = 0
+
+    def __enter__(self):
+        assert self.owner in (None, current_thread())
+        self.owner = current_thread()
+        self.count += 1
+
+    def __exit__(self, *args):
+        self.count -= 1
+        if not self.count:
+            self.owner = None
+
+
+class FakeInstrument:
+    def __init__(self, visa_address: str):
+        self.visa_address = visa_address
+        self.lock = FakeLock()
+
+
+class FakeChannel:
+    def __init__(self, instrument: FakeInstrument, voltage: float, current: float):
+        self.instrument = instrument
+        self.voltage = voltage
+        self.current = current
+        self.threads = []
+
+    def measure_voltage(self) -> float:
+        assert self.instrument.lock.owner is current_thread()
+        self.threads.append(current_thread())
+        return self.voltage
+
+    def measure_current(self) -> float:
+        assert self.instrument.lock.owner is current_thread()
+        self.threads.append(current_thread())
+        return self.current
+
+
+def test_measure_channels():
+    psu_a = FakeInstrument("TCPIP0::192.168.0.2::INSTR")
+    psu_b = FakeInstrument("ASRL/dev/ttyUSB0::INSTR")
+    channels = [
+        FakeChannel(psu_a, 1, 0.1),
+        FakeChannel(psu_b, 2, 0.2),
+        FakeChannel(psu_a, 3, 0.3),
+        FakeChannel(psu_b, 4, 0.4),
+    ]
+    assert measure_channels(channels) == [(1, 0.1), (2, 0.2), (3, 0.3), (4, 0.4)]
+
+    # Each instrument's channels are read in turn on one pool thread
+    for channel in channels:
+        assert channel.threads[0].name.startswith("instrument_io")
+    assert channels[0].threads == channels[2].threads
+    assert channels[1].threads == channels[3].threads
+    assert psu_a.lock.owner is None and psu_b.lock.owner is None
+
+
+def test_measure_channels_empty():
+    assert measure_channels([]) == []
+
+
+def test_measure_channels_shared_gpib_bus():
+    channels = [
+        FakeChannel(FakeInstrument("GPIB0::5::INSTR"), 1, 0.1),
+        FakeChannel(FakeInstrument("gpib0::6::INSTR"), 2, 0.2),
+    ]
+    assert measure_channels(channels) == [(1, 0.1), (2, 0.2)]
+    # Instruments on one GPIB bus can't talk at once so share a thread
+    assert channels[0].threads == channels[1].threads
@@ -0,0 +1,54 @@
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from AutomatedTesting.Instruments.BaseInstrument import BaseInstrument
+from AutomatedTesting.Instruments.SpectrumAnalyser.Siglent_SSA3032XPlus import (
+    Siglent_SSA3032XPlus,
+)
+
+
+def make_analyser(only_software_control: bool, responses: dict):
+    analyser = Siglent_SSA3032XPlus(
+        resource_manager=MagicMock(),
+        visa_address="TCPIP0::127.0.0.1::INSTR",
+        name="Test Analyser",
+        expected_idn_response="",
+        verify=False,
+        logger=logging.getLogger(__name__),
+        only_software_control=only_software_control,
+        prefer_binary=True,
+    )
+    analyser.dev = MagicMock()
+    analyser.dev.query.side_effect = responses.__getitem__
+    # Skip opening a connection and resetting
+    with patch.object(BaseInstrument, "initialise"):
+        analyser.initialise()
+    return analyser
+
+
+def sent_messages(analyser: Siglent_SSA3032XPlus) -> list:
+    return [call.args[0] for call in analyser.dev.write.call_args_list]
+
+
+def test_initialise_sets_binary_format():
+    analyser = make_analyser(True, {})
+    assert sent_messages(analyser) == [":FORM:TRAC:DATA REAL", ":FORM:BORD NORM"]
+    assert analyser.trace_data_binary
+
+
+@pytest.mark.parametrize(
+    "responses, binary, big_endian",
+    [
+        ({":FORM:TRAC:DATA?": "ASCii"}, False, True),
+        ({":FORM:TRAC:DATA?": "REAL", ":FORM:BORD?": "NORMal"}, True, True),
+        ({":FORM:TRAC:DATA?": "REAL", ":FORM:BORD?": "SWAPped"}, True, False),
+    ],
+)
+def test_initialise_interactive_control(responses, binary, big_endian):
+    # The format chosen on the front panel is read, not changed
+    analyser = make_analyser(False, responses)
+    analyser.dev.write.assert_not_called()
+    assert analyser.trace_data_binary == binary
+    assert analyser.trace_data_big_endian == big_endian
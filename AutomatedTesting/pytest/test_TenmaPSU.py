@@ -0,0 +1,91 @@
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+from AutomatedTesting.Instruments.PowerSupply import TenmaPSU
+from AutomatedTesting.Instruments.PowerSupply.TenmaPSU import Tenma_72_2535
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, delay: float):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(TenmaPSU, "monotonic", clock.monotonic)
+    monkeypatch.setattr(TenmaPSU, "sleep", clock.sleep)
+    return clock
+
+
+@pytest.fixture
+def psu(clock: FakeClock) -> Tenma_72_2535:
+    psu = Tenma_72_2535(
+        resource_manager=MagicMock(),
+        visa_address="ASRL/dev/ttyUSB0::INSTR",
+        name="Test PSU",
+        expected_idn_response="",
+        verify=False,
+        logger=logging.getLogger(__name__),
+    )
+    psu.dev = MagicMock()
+    return psu
+
+
+def test_transaction_interval(psu: Tenma_72_2535, clock: FakeClock):
+    psu._write("OUT1")
+    assert clock.sleeps == []
+    # Too soon after the last transaction, so waits out the rest
+    clock.now += 0.03
+    psu._write("OUT0")
+    assert clock.sleeps == [pytest.approx(psu.TRANSACTION_INTERVAL - 0.03)]
+
+    # Time spent between transactions counts towards the interval
+    clock.now += psu.TRANSACTION_INTERVAL
+    psu._write("OUT1")
+    assert len(clock.sleeps) == 1
+    assert psu.dev.write.call_count == 3
+
+
+def test_query_many(psu: Tenma_72_2535, clock: FakeClock):
+    responses = {"VSET1?": b"12.00", "VOUT1?": b"11.98", "ISET1?": b"1.000"}
+    lock_held = []
+
+    def write(command):
+        lock_held.append(psu.lock._is_owned())
+        psu.dev.read_bytes.return_value = responses[command]
+
+    psu.dev.write.side_effect = write
+    assert psu._query_many([("VSET1?", 5), ("VOUT1?", 5), ("ISET1?", 6)]) == [
+        b"12.00",
+        b"11.98",
+        b"1.000",
+    ]
+    assert [x.args[0] for x in psu.dev.read_bytes.call_args_list] == [5, 5, 6]
+    assert lock_held == [True, True, True]
+    # Every write and read after the first is still spaced out while
+    # holding the lock
+    assert clock.sleeps == [pytest.approx(psu.TRANSACTION_INTERVAL)] * 5
+
+
+def test_get_channel_telemetry(psu: Tenma_72_2535):
+    responses = {
+        "VSET1?": b"12.00",
+        "VOUT1?": b"11.98",
+        "ISET1?": b"1.000",
+        "IOUT1?": b"0.250",
+    }
+    psu.dev.write.side_effect = lambda command: setattr(
+        psu.dev.read_bytes, "return_value", responses[command]
+    )
+    assert psu.get_channel_telemetry(1) == (12.0, 11.98, 1.0, 0.25)